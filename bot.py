@@ -14,16 +14,40 @@ from discord.ext.commands import (
 from iam.log import new_logger
 from iam.config import BOT_TOKEN, PREFIX
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 LOG = None
 INTENTS = Intents.all()
 
+class IAMBot(Bot):
+    """Bot that cleanly closes connections to external services on exit."""
+    async def close(self):
+        """Flush pending database writes and close connections, then log out.
+
+        discord.py calls this on SIGINT/SIGTERM as well as on logout.
+        """
+        db = self.get_cog("Database")
+        if db is not None:
+            await db.close()
+        mail = self.get_cog("Mail")
+        if mail is not None:
+            mail.close()
+        await super().close()
+
 def main():
     global LOG
     new_logger("discord", f_level=INFO)
     LOG = new_logger(__name__)
     sys.excepthook = exception_handler
 
-    BOT = Bot(command_prefix=PREFIX, intents=INTENTS)
+    if uvloop is not None:
+        uvloop.install()
+        LOG.info("Using uvloop event loop")
+
+    BOT = IAMBot(command_prefix=PREFIX, intents=INTENTS)
 
     @BOT.event
     async def on_error(event, *args, **kwargs):
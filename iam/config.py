@@ -1,6 +1,10 @@
 """Handle loading config file."""
 
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 class ConfigFileNotFound(FileNotFoundError):
     """Config file does not exist."""
@@ -11,7 +15,7 @@ CONFIG_FILE = f"{CONFIG_DIR}/config.yml"
 
 try:
     with open(CONFIG_FILE, "r", encoding="utf-8") as fs:
-        config = yaml.load(fs, Loader=yaml.SafeLoader)
+        config = yaml.load(fs, Loader=SafeLoader)
     BOT_TOKEN = config["bot-token"]
     PREFIX = config["command-prefix"]
     SERVER_ID = config["server-id"]
@@ -1,6 +1,5 @@
 """Handle core functions of the bot."""
 
-from inspect import getdoc
 from discord.ext.commands import (
     Cog, Group, command, BadArgument, MissingRequiredArgument, 
     TooManyArguments, ArgumentParsingError
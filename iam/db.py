@@ -1,10 +1,23 @@
 """Handle database functions."""
 
+import os
+# gRPC's fork handlers add overhead to every call and are not needed, since
+# this process never forks. Only read when grpc is first imported.
+os.environ.setdefault("GRPC_ENABLE_FORK_SUPPORT", "0")
+
 import firebase_admin
-from firebase_admin import credentials, firestore
+from firebase_admin import credentials
+from google.cloud.firestore import AsyncClient
+from google.cloud.firestore_v1.field_path import FieldPath
+from google.cloud.firestore_v1.services.firestore import (
+    async_client as firestore_api_module
+)
+from google.cloud.firestore_v1.services.firestore.transports.grpc_asyncio \
+    import FirestoreGrpcAsyncIOTransport
 import google.cloud.exceptions
-from logging import DEBUG, INFO
-from time import time
+from asyncio import Event, create_task, gather, sleep
+from itertools import cycle
+from time import monotonic, time
 from secrets import token_bytes
 from discord.ext.commands import Cog
 
@@ -26,6 +39,48 @@ COL_MEMBERS = "members"
 COL_SECRETS = "secrets"
 """Name of secrets collection in database"""
 
+UNVERIFIED_PAGE_SIZE = 500
+"""Number of unverified members to retrieve per query."""
+
+MEMBER_CACHE_TTL = 60
+"""Seconds to reuse a retrieved member entry for."""
+
+MEMBER_CACHE_SIZE = 4096
+"""Maximum number of member entries to keep in memory."""
+
+WRITE_BATCH_DELAY = 0.25
+"""Seconds to collect background writes for before committing them."""
+
+WRITE_BATCH_SIZE = 500
+"""Maximum number of writes per batch, as limited by Firestore."""
+
+WRITE_RETRY_DELAY = 1
+"""Seconds to wait before first retrying background writes that failed."""
+
+WRITE_RETRY_MAX_DELAY = 60
+"""Most seconds to wait between retries of background writes that failed."""
+
+FIRESTORE_POOL_SIZE = 4
+"""Number of Firestore clients to spread requests across."""
+
+MEMBER_ID_FIELD = FieldPath.document_id()
+"""Field path to select when only member IDs are wanted from a query.
+
+An empty projection returns every field, so this is selected instead."""
+
+KEEPALIVE_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1)
+]
+"""gRPC channel options added to those the Firestore SDK sets.
+
+The SDK already sends a keepalive ping every 30 seconds, but only while calls
+are in flight. These options also ping idle channels, so they are not
+silently dropped by NATs or proxies between requests."""
+
+_CLIENTS = None
+"""Firestore clients shared by all Database instances in this process."""
+
 def setup(bot):
     """Add Database cog to bot and set up logging.
 
@@ -91,20 +146,28 @@ class MemberKey:
     EMAIL_ATTEMPTS = "_email_verify_attempts"
     MAX_EMAIL_ATTEMPTS = "_max_email_verify_attempts"
 
+MEMBER_FLAG_KEYS = (MemberKey.ID_VER, MemberKey.EMAIL_VER)
+"""MemberKeys retrieved by Database.get_member_flags."""
+
+DEFAULT_MEMBER_DATA = {
+    MemberKey.NAME: None,
+    MemberKey.ZID: None,
+    MemberKey.EMAIL: None,
+    MemberKey.EMAIL_VER: False,
+    MemberKey.ID_MESSAGE: None,
+    MemberKey.ID_VER: False,
+    MemberKey.VER_EXEC: None,
+    MemberKey.VER_STATE: None,
+    MemberKey.VER_TIME: None,
+    MemberKey.EMAIL_ATTEMPTS: 0,
+    MemberKey.MAX_EMAIL_ATTEMPTS: MAX_VER_EMAILS
+}
+"""Template for new member entries. Copied by make_def_member_data."""
+
 def make_def_member_data():
-    return {
-        MemberKey.NAME: None,
-        MemberKey.ZID: None,
-        MemberKey.EMAIL: None,
-        MemberKey.EMAIL_VER: False,
-        MemberKey.ID_MESSAGE: None,
-        MemberKey.ID_VER: False,
-        MemberKey.VER_EXEC: None,
-        MemberKey.VER_STATE: None,
-        MemberKey.VER_TIME: time(),
-        MemberKey.EMAIL_ATTEMPTS: 0,
-        MemberKey.MAX_EMAIL_ATTEMPTS: MAX_VER_EMAILS
-    }
+    data = DEFAULT_MEMBER_DATA.copy()
+    data[MemberKey.VER_TIME] = time()
+    return data
 
 class SecretID:
     """Names for secret entries in database."""
@@ -112,19 +175,61 @@ class SecretID:
 
 class Database(Cog):
     """Handle database functions.
+
+    All methods that talk to Firestore are coroutines so that network I/O
+    does not block the bot's event loop.
+    
+    Requests are spread round-robin across a pool of clients, each with its
+    own gRPC channel, so a burst of requests is not serialised on one
+    connection.
+
+    Connection to Firestore is deferred until the bot is ready, so loading
+    this cog does not hold up the bot logging in to Discord.
     
     Attributes:
-        db: Connected Firestore Client.
+        certificate_file: Path to Firebase certificate file.
+        pool: List of connected async Firestore Clients. None until first
+              request.
     """
     def __init__(self, certificate_file, logger):
-        """Init cog and connect to Firestore."""
+        """Init cog."""
         LOG.debug(f"Initialising {COG_NAME} cog...")
-        self.db = firestore_connect(certificate_file)
+        self.certificate_file = certificate_file
+        self.pool = None
+        self._clients = None
+        self._members_cols = None
+        self._secrets_cols = None
         self.logger = logger
+        self._secret_cache = {}
+        self._member_cache = {}
+        self._flags_cache = {}
+        self._missing_cache = {}
+        self._write_gens = {}
+        self._pending_writes = {}
+        self._committing_writes = {}
+        self._commit_done = None
+        self._write_task = None
+
+    @Cog.listener()
+    async def on_ready(self):
+        """Connect to Firestore and load verification secret once bot is ready.
+
+        This way the first member to verify does not have to wait for either.
+        """
+        if SecretID.VERIFY not in self._secret_cache:
+            await self.get_secret(SecretID.VERIFY)
 
-    def get_member_data(self, id):
+    async def get_member_data(self, id):
         """Retrieve entry for member in database.
 
+        Entry is reused for MEMBER_CACHE_TTL seconds. Writes made through this
+        cog in the meantime are applied to the reused entry, and background
+        writes not yet committed are applied to entries read from Firestore.
+        Members without
+        an entry are remembered for as long, so repeated lookups for them do
+        not go to Firestore either. Nothing is cached if the entry is written
+        while it is being read, as the read may predate the write.
+
         Args:
             id: Discord ID of member.
         
@@ -134,39 +239,146 @@ class Database(Cog):
         Raises:
             MemberNotFound: If member does not exist in database.
         """
-        data = self._get_member_doc(id).get().to_dict()
+        cached = self._member_cache.get(id)
+        if cached is not None and monotonic() - cached[0] < MEMBER_CACHE_TTL:
+            return dict(cached[1])
+        if self._is_cached_missing(id):
+            raise MemberNotFound(id, "get_member_data")
+
+        write_gen = self._write_gens.get(id, 0)
+        data = (await self._get_member_doc(id).get()).to_dict()
+        is_current = self._write_gens.get(id, 0) == write_gen
         if data is None:
+            if is_current:
+                self._cache_missing(id)
             raise MemberNotFound(id, "get_member_data")
-        return data
 
-    def get_unverified_members_data(self):
-        """Retrieve entries for all unverified members in database.
+        data.update(self._get_unsaved_patch(id))
+        if is_current:
+            self._cache_member_data(id, data)
+        return dict(data)
+
+    async def get_member_flags(self, id):
+        """Retrieve verification flags of member in database.
+
+        Only the flag fields are read from the database, and the result is
+        reused for MEMBER_CACHE_TTL seconds. Served from the full member entry
+        if that is already cached. Not cached if the entry is written while it
+        is being read.
+
+        Args:
+            id: Discord ID of member.
 
         Returns:
-            Dict where each key is member ID and each value is info associated
-            with that member.
-        """
-        unverified = {}
-        docs = self._get_members_col() \
-            .where(MemberKey.ID_VER, "==", False).stream()
-        for doc in docs:
-            member_id = int(doc.id)
-            member_data = doc.to_dict()
-            unverified[member_id] = member_data
-        return unverified
-
-    def set_member_data(self, id, info):
+            Dict containing MEMBER_FLAG_KEYS and their values for member.
+
+        Raises:
+            MemberNotFound: If member does not exist in database.
+        """
+        for cache in (self._member_cache, self._flags_cache):
+            cached = cache.get(id)
+            if cached is not None \
+                and monotonic() - cached[0] < MEMBER_CACHE_TTL:
+                return {k: cached[1].get(k) for k in MEMBER_FLAG_KEYS}
+        if self._is_cached_missing(id):
+            raise MemberNotFound(id, "get_member_flags")
+
+        write_gen = self._write_gens.get(id, 0)
+        snapshot = await self._get_member_doc(id).get(
+            field_paths=list(MEMBER_FLAG_KEYS))
+        is_current = self._write_gens.get(id, 0) == write_gen
+        if not snapshot.exists:
+            if is_current:
+                self._cache_missing(id)
+            raise MemberNotFound(id, "get_member_flags")
+
+        data = {**snapshot.to_dict(), **self._get_unsaved_patch(id)}
+        flags = {k: data.get(k) for k in MEMBER_FLAG_KEYS}
+        if is_current:
+            if len(self._flags_cache) >= MEMBER_CACHE_SIZE:
+                del self._flags_cache[next(iter(self._flags_cache))]
+            self._flags_cache[id] = (monotonic(), flags)
+        return dict(flags)
+
+    async def iter_unverified_members(self, fields=None, ver_state=None,
+        page_size=UNVERIFIED_PAGE_SIZE):
+        """Iterate over entries for all unverified members in database.
+
+        Members are retrieved in pages ordered by document ID, so only one page
+        is held in memory at a time and no single query runs long enough to
+        time out. Each page is fetched in a single streamed request rather than
+        one request per member.
+
+        If full entries are retrieved, they are also cached so that following
+        lookups of the same members do not go back to the database.
+
+        Args:
+            fields: Iterable of MemberKeys to retrieve for each member. If None,
+                    retrieve all keys. If empty or [MEMBER_ID_FIELD], only
+                    member IDs are retrieved.
+            ver_state: Only retrieve members in this verification state. If
+                       None, retrieve members in any state.
+            page_size: Number of members to retrieve per query.
+
+        Yields:
+            Tuple of member ID and dict of info associated with that member.
+        """
+        query = self._get_members_col().where(MemberKey.ID_VER, "==", False)
+        if ver_state is not None:
+            query = query.where(MemberKey.VER_STATE, "==", ver_state)
+        query = query.order_by("__name__").limit(page_size)
+        if fields is not None:
+            query = query.select(list(fields) or [MEMBER_ID_FIELD])
+
+        cursor = None
+        while True:
+            page = query if cursor is None else query.start_after(cursor)
+            count = 0
+            async for doc in page.stream():
+                count += 1
+                cursor = doc
+                member_id = int(doc.id)
+                data = doc.to_dict()
+                if fields is None:
+                    data.update(self._get_unsaved_patch(member_id))
+                    self._cache_member_data(member_id, data)
+                    data = dict(data)
+                yield member_id, data
+            if count < page_size:
+                return
+
+    async def set_member_data(self, id, info, merge=False):
         """Write entry for member to database.
         
-        If entry already exists, replace it.
+        If entry already exists, replace it, unless merge is True, in which
+        case only the given keys are written and all others are kept. Unlike
+        update_member_data, a merge will create the entry if it does not exist.
 
         Args:
             id: Discord ID of member.
             info: Dict of keys and values to write.
+            merge: Boolean for if info should be merged into existing entry.
         """
-        self._get_member_doc(id).set(info)
+        self._uncache_member_data(id)
+        await self._wait_for_commit(id)
+        queued = self._pending_writes.pop(id, None)
+        if merge and queued is not None:
+            info = {**queued, **info}
+        try:
+            await self._get_member_doc(id).set(info, merge=merge)
+        except Exception:
+            if queued is not None:
+                self._requeue_write(id, queued)
+                self._schedule_write_pending()
+            raise
+        finally:
+            self._bump_write_gen(id)
+        if not merge:
+            self._cache_member_data(id, dict(info))
+        else:
+            self._uncache_member_data(id)
 
-    def update_member_data(self, id, patch, must_exist=True):
+    async def update_member_data(self, id, patch, must_exist=True):
         """Update entry for member in database.
         
         Will only modify given keys and values. If key does not already exist,
@@ -184,17 +396,85 @@ class Database(Cog):
             MemberNotFound: If member does not exist in database and
                             must_exist == True.
         """
+        await self._wait_for_commit(id)
+        queued = self._pending_writes.pop(id, None)
+        if queued is not None:
+            patch = {**queued, **patch}
         try:
-            self._get_member_doc(id).update(patch)
+            await self._get_member_doc(id).update(patch)
         except google.cloud.exceptions.NotFound:
+            self._uncache_member_data(id)
             LOG.warning(f"Failed to update member '{id}' entry in database - "
                 "they do not exist")
             raise MemberNotFound(id, "update_member_data")
+        except Exception:
+            if queued is not None:
+                self._requeue_write(id, queued)
+                self._schedule_write_pending()
+            raise
+        finally:
+            self._bump_write_gen(id)
+        self._patch_cached_member_data(id, patch)
+
+    def update_member_data_nowait(self, id, patch):
+        """Update entry for member in database without waiting for the write.
+
+        Write is queued and this returns immediately, so callers that do not
+        depend on the write being confirmed are not held up by the round-trip
+        to Firestore. Patch is applied to the cached entry straight away.
+
+        Queued writes are collected for WRITE_BATCH_DELAY seconds, then
+        committed together in batches. Patches to the same member are merged
+        into one write. Failed writes are queued again and retried with
+        backoff. A queued write is instead sent with the next
+        update_member_data or set_member_data call for the member, and is
+        dropped if the member is deleted. If that call fails, the queued write
+        is put back in the queue. Those calls first wait for any batch
+        already being committed for the member, so a queued write never lands
+        after a newer write made through them.
 
-    def delete_member_data(self, id, must_exist=True):
+        Args:
+            id: Discord ID of member.
+            patch: Dict of keys and values to write.
+        """
+        self._bump_write_gen(id)
+        self._patch_cached_member_data(id, patch)
+        self._pending_writes[id] = {**self._pending_writes.get(id, {}),
+            **patch}
+        self._schedule_write_pending()
+
+    async def flush(self):
+        """Commit all queued background writes and wait for them to finish.
+
+        Writes are tried once more rather than retried until they succeed, so
+        this returns even if Firestore cannot be reached. Writes that still
+        fail are logged and dropped.
+        """
+        if self._write_task is not None and not self._write_task.done():
+            self._write_task.cancel()
+            await gather(self._write_task, return_exceptions=True)
+        await self._write_pending(0, retry=False)
+
+    async def close(self):
+        """Finish background writes and close connections to Firestore.
+
+        Cog will reconnect if another request is made afterwards.
+        """
+        await self.flush()
+        if self.pool is None:
+            return
+        await firestore_close()
+        self.pool = None
+        self._clients = None
+        self._members_cols = None
+        self._secrets_cols = None
+
+    async def delete_member_data(self, id, must_exist=True):
         """Delete entry for member in database.
 
         By default, will raise exception if member does not exist in database.
+        Existence is checked by Firestore as a precondition of the delete, so
+        this only costs one round-trip.
 
         Args:
             id: Discord ID of member.
@@ -205,17 +485,27 @@ class Database(Cog):
             MemberNotFound: If member does not exist in database and
                             must_exist == True.
         """
-        doc = self._get_member_doc(id)
-        if must_exist and doc.get().to_dict() is None:
+        self._uncache_member_data(id)
+        await self._wait_for_commit(id)
+        self._pending_writes.pop(id, None)
+        option = AsyncClient.write_option(exists=True) if must_exist else None
+        try:
+            await self._get_member_doc(id).delete(option=option)
+        except google.cloud.exceptions.NotFound:
             LOG.warning(f"Failed to delete member '{id}' in database - "
                 "they do not exist")
             raise MemberNotFound(id, "delete_member_data")
-        doc.delete()
+        finally:
+            self._bump_write_gen(id)
 
-    def get_secret(self, id):
+    async def get_secret(self, id):
         """Retrieve entry for secret from database.
 
-        If no such secret exists, generate one.
+        If no such secret exists, generate one. If another process generates
+        it at the same time, the one that was stored first is used.
+
+        Secrets are kept in memory after first retrieval, so only the first
+        call for each id touches the database.
         
         Args:
             id: ID of secret.
@@ -223,17 +513,27 @@ class Database(Cog):
         Returns:
             Secret bytes associated with id.
         """
+        if id in self._secret_cache:
+            return self._secret_cache[id]
+
         doc = self._get_secrets_col().document(str(id))
-        data = doc.get().to_dict()
+        data = (await doc.get(field_paths=["secret"])).to_dict()
         
         if data is not None:
             secret = data["secret"]
         else:
             LOG.info(f"Generating new '{id}' secret...")
             secret = token_bytes(64)
-            doc.set({"secret": secret})
-            LOG.info(f"Saved new '{id}' secret in Firebase")
+            try:
+                await doc.create({"secret": secret})
+            except google.cloud.exceptions.Conflict:
+                LOG.info(f"'{id}' secret was created elsewhere, using it")
+                snapshot = await doc.get(field_paths=["secret"])
+                secret = snapshot.to_dict()["secret"]
+            else:
+                LOG.info(f"Saved new '{id}' secret in Firebase")
         
+        self._secret_cache[id] = secret
         return secret
     
     def _get_member_doc(self, id):
@@ -247,13 +547,252 @@ class Database(Cog):
         """
         return self._get_members_col().document(str(id))
 
+    async def rotate_secret(self, id):
+        """Replace entry for secret in database with a newly generated one.
+
+        Anything derived from the old secret, such as verification codes that
+        have already been sent, will no longer be valid. Other processes that
+        have already retrieved the old secret keep using it until restarted.
+
+        Args:
+            id: ID of secret.
+
+        Returns:
+            New secret bytes associated with id.
+        """
+        LOG.info(f"Rotating '{id}' secret...")
+        secret = token_bytes(64)
+        await self._get_secrets_col().document(str(id)).set({"secret": secret})
+        self._secret_cache[id] = secret
+        LOG.info(f"Saved rotated '{id}' secret in Firebase")
+        return secret
+
+    async def _write_pending(self, delay, retry=True):
+        """Commit queued background writes in batches.
+
+        Writes that fail are queued again, merged under any newer writes to
+        the same members, and retried after a delay that doubles on each
+        failure up to WRITE_RETRY_MAX_DELAY.
+
+        Args:
+            delay: Seconds to wait for more writes before committing.
+            retry: Boolean for if failed writes should be retried. If False,
+                   they are logged and dropped instead.
+        """
+        await sleep(delay)
+        retry_delay = WRITE_RETRY_DELAY
+        while len(self._pending_writes) > 0:
+            ids = list(self._pending_writes)[:WRITE_BATCH_SIZE]
+            writes = {id: self._pending_writes.pop(id) for id in ids}
+            self._committing_writes = writes
+            self._commit_done = Event()
+            failed = writes
+            try:
+                failed = await self._commit_writes(writes)
+            finally:
+                if retry:
+                    for id, patch in failed.items():
+                        self._requeue_write(id, patch)
+                else:
+                    for id in failed:
+                        self._uncache_member_data(id)
+                for id in writes:
+                    self._bump_write_gen(id)
+                self._committing_writes = {}
+                self._commit_done.set()
+
+            if len(failed) == 0 or not retry:
+                retry_delay = WRITE_RETRY_DELAY
+                continue
+            LOG.warning(f"Retrying {len(failed)} background write(s) in "
+                f"{retry_delay} seconds...")
+            await sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, WRITE_RETRY_MAX_DELAY)
+
+    def _schedule_write_pending(self):
+        """Start committing queued writes after WRITE_BATCH_DELAY seconds.
+
+        Does nothing if queued writes are already going to be committed.
+        """
+        if self._write_task is None or self._write_task.done():
+            self._write_task = create_task(self._write_pending(
+                WRITE_BATCH_DELAY))
+
+    def _requeue_write(self, id, patch):
+        """Put write that failed back in queue, under newer queued writes.
+
+        Args:
+            id: Discord ID of member.
+            patch: Dict of keys and values that failed to be written.
+        """
+        self._pending_writes[id] = {**patch,
+            **self._pending_writes.get(id, {})}
+
+    async def _commit_writes(self, writes):
+        """Commit background writes in a single batch.
+
+        If the batch fails because a member does not exist, its writes are
+        made one by one so the others still go through.
+
+        Args:
+            writes: Dict where each key is member ID and each value is patch to
+                    write to that member.
+
+        Returns:
+            Dict of writes from given writes that failed and can be retried.
+        """
+        LOG.debug(f"Committing {len(writes)} background write(s)...")
+        batch = self._get_client().batch()
+        for id, patch in writes.items():
+            batch.update(self._get_member_doc(id), patch)
+        try:
+            await batch.commit()
+            return {}
+        except google.cloud.exceptions.NotFound:
+            pass
+        except Exception:
+            LOG.exception(f"Failed to commit {len(writes)} background "
+                "write(s)")
+            return writes
+
+        failed = {}
+        for id, patch in writes.items():
+            try:
+                await self._get_member_doc(id).update(patch)
+            except google.cloud.exceptions.NotFound:
+                self._uncache_member_data(id)
+                LOG.warning(f"Failed to update member '{id}' entry in "
+                    "database in background - they do not exist")
+            except Exception:
+                LOG.exception(f"Failed to update member '{id}' entry in "
+                    "database in background")
+                failed[id] = patch
+        return failed
+
+    async def _wait_for_commit(self, id):
+        """Wait until no background write for member is being committed.
+
+        Args:
+            id: Discord ID of member.
+        """
+        while id in self._committing_writes:
+            await self._commit_done.wait()
+
+    def _bump_write_gen(self, id):
+        """Record that entry for member was written.
+
+        Reads of the entry that were already in flight compare against this
+        and skip caching what they read, as it may predate the write.
+
+        Args:
+            id: Discord ID of member.
+        """
+        self._write_gens[id] = self._write_gens.get(id, 0) + 1
+
+    def _get_unsaved_patch(self, id):
+        """Get background writes for member not yet committed to Firestore.
+
+        Args:
+            id: Discord ID of member.
+
+        Returns:
+            Dict of keys and values queued or being committed for member.
+        """
+        return {**self._committing_writes.get(id, {}),
+            **self._pending_writes.get(id, {})}
+
+    def _cache_member_data(self, id, data):
+        """Store member entry in cache, evicting oldest entry if full.
+
+        Args:
+            id: Discord ID of member.
+            data: Dict of keys and values associated with member.
+        """
+        self._uncache_member_data(id)
+        if len(self._member_cache) >= MEMBER_CACHE_SIZE:
+            del self._member_cache[next(iter(self._member_cache))]
+        self._member_cache[id] = (monotonic(), data)
+
+    def _patch_cached_member_data(self, id, patch):
+        """Apply patch to cached member entry, if there is one.
+
+        Entry is then current as of the patch, so it is kept for another
+        MEMBER_CACHE_TTL seconds.
+
+        Args:
+            id: Discord ID of member.
+            patch: Dict of keys and values written to member entry.
+        """
+        for cache in (self._member_cache, self._flags_cache):
+            cached = cache.get(id)
+            if cached is not None:
+                cache[id] = (monotonic(), {**cached[1], **patch})
+
+    def _uncache_member_data(self, id):
+        """Forget cached entry, flags and absence of member, if present.
+
+        Args:
+            id: Discord ID of member.
+        """
+        self._member_cache.pop(id, None)
+        self._flags_cache.pop(id, None)
+        self._missing_cache.pop(id, None)
+
+    def _cache_missing(self, id):
+        """Remember that member has no entry, evicting oldest if full.
+
+        Args:
+            id: Discord ID of member.
+        """
+        if len(self._missing_cache) >= MEMBER_CACHE_SIZE:
+            del self._missing_cache[next(iter(self._missing_cache))]
+        self._missing_cache[id] = monotonic()
+
+    def _is_cached_missing(self, id):
+        """Check if member was recently found to have no entry.
+
+        Args:
+            id: Discord ID of member.
+
+        Returns:
+            Boolean for if member has no entry as of MEMBER_CACHE_TTL seconds
+            ago or less.
+        """
+        cached = self._missing_cache.get(id)
+        return cached is not None and monotonic() - cached < MEMBER_CACHE_TTL
+
+    def _connect(self):
+        """Connect to Firestore if not yet connected.
+
+        Collection references for each client in the pool are built once here
+        rather than on every request.
+        """
+        if self.pool is not None:
+            return
+        self.pool = firestore_connect(self.certificate_file)
+        self._clients = cycle(self.pool)
+        self._members_cols = cycle([c.collection(COL_MEMBERS)
+            for c in self.pool])
+        self._secrets_cols = cycle([c.collection(COL_SECRETS)
+            for c in self.pool])
+
+    def _get_client(self):
+        """Get next client from pool.
+
+        Returns:
+            Async Firestore client.
+        """
+        self._connect()
+        return next(self._clients)
+
     def _get_members_col(self):
         """Get members collection.
 
         Returns:
             Firestore collection of members.
         """
-        return self.db.collection(COL_MEMBERS)
+        self._connect()
+        return next(self._members_cols)
     
     def _get_secrets_col(self):
         """Get secrets collection.
@@ -261,19 +800,79 @@ class Database(Cog):
         Returns:
             Firestore collection of secrets.
         """
-        return self.db.collection(COL_SECRETS)
+        self._connect()
+        return next(self._secrets_cols)
+
+class KeepaliveGrpcAsyncIOTransport(FirestoreGrpcAsyncIOTransport):
+    """Firestore gRPC transport whose channels keep themselves alive."""
+
+    @classmethod
+    def create_channel(cls, *args, options=(), **kwargs):
+        """Create gRPC channel with KEEPALIVE_CHANNEL_OPTIONS added.
+
+        Returns:
+            gRPC AsyncIO channel object.
+        """
+        return super().create_channel(*args,
+            options=[*options, *KEEPALIVE_CHANNEL_OPTIONS], **kwargs)
+
+class KeepaliveAsyncClient(AsyncClient):
+    """Async Firestore client that keeps its gRPC channel alive when idle.
+
+    Identical to AsyncClient, except its channel is created by
+    KeepaliveGrpcAsyncIOTransport. The API client is still built by the SDK's
+    own helper, so emulator and client info handling are unchanged.
+    """
+
+    @property
+    def _firestore_api(self):
+        return self._firestore_api_helper(KeepaliveGrpcAsyncIOTransport,
+            firestore_api_module.FirestoreAsyncClient, firestore_api_module)
 
 def firestore_connect(certificate_file):
     """Connect to Firestore.
     
     Required for all other methods to function.
 
+    Clients are created on first call and reused for the lifetime of the
+    process, so reloading the Database cog does not redo auth or rebuild the
+    gRPC channels. All clients share the same credentials.
+
     Returns:
-        Firestore client object.
+        List of FIRESTORE_POOL_SIZE async Firestore client objects.
     """
+    global _CLIENTS
+    if _CLIENTS is not None:
+        LOG.debug("Reusing existing Firestore clients")
+        return _CLIENTS
+
     LOG.debug("Logging in to Firebase...")
-    cred = credentials.Certificate(certificate_file)
-    firebase_admin.initialize_app(cred)
-    client = firestore.client()
+    try:
+        app = firebase_admin.get_app()
+    except ValueError:
+        cred = credentials.Certificate(certificate_file)
+        app = firebase_admin.initialize_app(cred)
+    cred = app.credential.get_credential()
+    _CLIENTS = [KeepaliveAsyncClient(credentials=cred, project=app.project_id)
+        for _ in range(FIRESTORE_POOL_SIZE)]
     LOG.info("Logged in to Firebase")
-    return client
+    return _CLIENTS
+
+async def firestore_close():
+    """Close connections of all clients created by firestore_connect.
+
+    Next call to firestore_connect will create new clients.
+    """
+    global _CLIENTS
+    if _CLIENTS is None:
+        return
+    LOG.debug("Closing Firestore connections...")
+    for client in _CLIENTS:
+        # AsyncClient only creates its gRPC transport on first request, and
+        # has no public method to close it.
+        transport = getattr(client, "_transport", None)
+        if transport is not None:
+            await transport.close()
+        client.close()
+    _CLIENTS = None
+    LOG.info("Closed Firestore connections")
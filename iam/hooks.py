@@ -1,7 +1,7 @@
 """Handle command permissions."""
 
 from logging import DEBUG, INFO
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import iscoroutinefunction
 from discord import User, Member
 from discord.ext.commands import Context
@@ -12,6 +12,12 @@ from iam.config import (
     PREFIX, SERVER_ID, VERIF_ROLE, VER_CHANNEL, ADMIN_CHANNEL, ADMIN_ROLES
 )
 
+ADMIN_ROLE_IDS = frozenset(ADMIN_ROLES)
+"""Set of IDs of admin roles defined in config."""
+
+COMMAND_PREFIXES = (PREFIX,) if isinstance(PREFIX, str) else tuple(PREFIX)
+"""Tuple of command prefixes defined in config."""
+
 class CheckFailed(Exception):
     """Event pre-execution check failed.
 
@@ -53,25 +59,12 @@ class CheckResult:
         self.status = status
         self.msg = msg
 
-def make_coro(func):
-    """Turns a function into a coroutine without modifying its behaviour.
-
-    Args:
-        func: The function to convert.
-
-    Returns:
-        Coroutine of given function, or original function if already async.
-    """
-    if not iscoroutinefunction(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
-        return wrapper
-    return func
-
 def pre(action):
     """Decorate function to execute a function before itself.
 
+    Synchronous actions are called directly rather than being wrapped in a
+    coroutine, even when decorating a coroutine.
+
     Args:
         action: Function to execute. Takes in the following args:
             func: Function being invoked.
@@ -79,10 +72,15 @@ def pre(action):
             **kwargs: Keyword args supplied to function call.
     """
     def decorator(func):
-        if iscoroutinefunction(func):
+        if iscoroutinefunction(func) and iscoroutinefunction(action):
             @wraps(func)
             async def wrapper(*args, **kwargs):
-                if await make_coro(action)(func, *args, **kwargs):
+                if await action(func, *args, **kwargs):
+                    return await func(*args, **kwargs)
+        elif iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                if action(func, *args, **kwargs):
                     return await func(*args, **kwargs)
         else:
             @wraps(func)
@@ -95,6 +93,9 @@ def pre(action):
 def post(action):
     """Decorate function to execute a function after itself.
 
+    Synchronous actions are called directly rather than being wrapped in a
+    coroutine, even when decorating a coroutine.
+
     Args:
         action: Function to execute. Takes in the following args:
             func: Function being invoked.
@@ -102,11 +103,17 @@ def post(action):
             **kwargs: Keyword args supplied to function call.
     """
     def decorator(func):
-        if iscoroutinefunction(func):
+        if iscoroutinefunction(func) and iscoroutinefunction(action):
             @wraps(func)
             async def wrapper(*args, **kwargs):
                 ret_val = await func(*args, **kwargs)
-                if await make_coro(action)(func, *args, **kwargs):
+                if await action(func, *args, **kwargs):
+                    return ret_val
+        elif iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                ret_val = await func(*args, **kwargs)
+                if action(func, *args, **kwargs):
                     return ret_val
         else:
             @wraps(func)
@@ -163,10 +170,12 @@ def log_success(logger, meta="", level=DEBUG):
     info = ["execute success", meta]
     return log(logger, meta=" - ".join(filter(None, info)), level=level)
 
+@lru_cache(maxsize=None)
 def check(check_func, level=DEBUG, notify=False):
     """Performs check on function call to determine if it should proceed.
 
-    For use with the pre and post decorators.
+    For use with the pre and post decorators. Actions are built once for each
+    combination of args and shared by all functions decorated with them.
 
     Args:
         check_func: A function that takes in the args/kwargs supplied to the
@@ -179,27 +188,63 @@ def check(check_func, level=DEBUG, notify=False):
                 invocation context if check fails.        
 
     Returns:
-        An "action" function usable with the pre and post decorators.
+        An "action" function usable with the pre and post decorators. Action
+        is only a coroutine if check_func is, so synchronous checks are not
+        wrapped in a coroutine.
     """
-    async def action(func, cog, obj, *args, **kwargs):
-        """Performs check on function call to determine if it should proceed.
-        
+    def handle_failure(func, res, cog, obj, *args, **kwargs):
+        """Log and notify on failed check result.
+
         Args:
             func: Function being invoked.
+            res: Failed CheckResult returned by check_func.
             cog: Cog associated with function invocation.
             obj: Object associated with function invocation.
 
         Returns:
-            Boolean result of check.
+            False.
         """
-        res = await make_coro(check_func)(cog, obj, *args, **kwargs)
-        if not res.status:
-            if level is not None:
-                log_func(cog.logger, level, f"{func.__name__}: failed check " 
-                    f"'{check_func.__name__}'", *(obj, *args), **kwargs)
-            if notify:
-                raise CheckFailed(obj, res.msg)
-        return res.status
+        if level is not None:
+            log_func(cog.logger, level, f"{func.__name__}: failed check " 
+                f"'{check_func.__name__}'", *(obj, *args), **kwargs)
+        if notify:
+            raise CheckFailed(obj, res.msg)
+        return False
+
+    if iscoroutinefunction(check_func):
+        async def action(func, cog, obj, *args, **kwargs):
+            """Performs check on function call to determine if it should
+            proceed.
+            
+            Args:
+                func: Function being invoked.
+                cog: Cog associated with function invocation.
+                obj: Object associated with function invocation.
+
+            Returns:
+                Boolean result of check.
+            """
+            res = await check_func(cog, obj, *args, **kwargs)
+            if res.status:
+                return True
+            return handle_failure(func, res, cog, obj, *args, **kwargs)
+    else:
+        def action(func, cog, obj, *args, **kwargs):
+            """Performs check on function call to determine if it should
+            proceed.
+            
+            Args:
+                func: Function being invoked.
+                cog: Cog associated with function invocation.
+                obj: Object associated with function invocation.
+
+            Returns:
+                Boolean result of check.
+            """
+            res = check_func(cog, obj, *args, **kwargs)
+            if res.status:
+                return True
+            return handle_failure(func, res, cog, obj, *args, **kwargs)
     return action
 
 def has_verified_role(cog, obj, *args, **kwargs):
@@ -218,11 +263,11 @@ def has_verified_role(cog, obj, *args, **kwargs):
         2. Error message to supply, if check failed.
     """
     member = get_member(cog.bot, obj.author)
-    if member is None or VERIF_ROLE not in get_role_ids(member):
+    if member is None or not has_role(member, VERIF_ROLE):
         return CheckResult(False, "You must be verified to do that.")
     return CheckResult(True, None)
 
-def was_verified_user(cog, obj, *args, **kwargs):
+async def was_verified_user(cog, obj, *args, **kwargs):
     """Checks that user that invoked function was verified in past.
     
     Verified in past defined as either verified in the database or currently
@@ -238,17 +283,10 @@ def was_verified_user(cog, obj, *args, **kwargs):
         1. Boolean result of check.
         2. Error message to supply, if check failed.
     """
-    if not (isinstance(obj, User) or isinstance(obj, Member)):
+    if not isinstance(obj, (User, Member)):
         obj = obj.author
-    member = get_member(cog.bot, obj)
-    if member is not None and VERIF_ROLE in get_role_ids(member):
+    if await was_verified(cog, obj):
         return CheckResult(True, None)
-    try:
-        member_data = cog.db.get_member_data(obj.id)
-        if member_data[MemberKey.ID_VER]:
-            return CheckResult(True, None)
-    except MemberNotFound:
-        pass
     return CheckResult(False, "You must be verified to do that.")
 
 def is_unverified_user(cog, obj, *args, **kwargs):
@@ -267,11 +305,11 @@ def is_unverified_user(cog, obj, *args, **kwargs):
         2. Error message to supply, if check failed.
     """
     member = get_member(cog.bot, obj.author)
-    if member is not None and VERIF_ROLE in get_role_ids(member):
+    if member is not None and has_role(member, VERIF_ROLE):
         return CheckResult(False, "You are already verified.")
     return CheckResult(True, None)
 
-def verified_in_db(cog, obj, *args, **kwargs):
+async def verified_in_db(cog, obj, *args, **kwargs):
     """Checks that user that invoked function is verified in database.
 
     Associated cog must have bot and db as instance variables.
@@ -285,10 +323,12 @@ def verified_in_db(cog, obj, *args, **kwargs):
         2. Error message to supply, if check failed.
     """
     member = obj
-    if not (isinstance(obj, User) or isinstance(obj, Member)):
+    if not isinstance(obj, (User, Member)):
         member = obj.author
+    if member.bot:
+        return CheckResult(False, "You are not human.")
     try:
-        member_data = cog.db.get_member_data(member.id)
+        member_data = await cog.db.get_member_flags(member.id)
         if member_data[MemberKey.ID_VER]:
             return CheckResult(True, None)
     except MemberNotFound:
@@ -296,7 +336,7 @@ def verified_in_db(cog, obj, *args, **kwargs):
     return CheckResult(False, "Could not find your details in the database. "
         "Please contact an admin.")
 
-def never_verified_user(cog, obj, *args, **kwargs):
+async def never_verified_user(cog, obj, *args, **kwargs):
     """Checks that user that invoked function was never verified in past.
     
     Verified in past defined as either verified in the database or currently
@@ -312,14 +352,8 @@ def never_verified_user(cog, obj, *args, **kwargs):
         1. Boolean result of check.
         2. Error message to supply, if check failed.
     """
-    member = get_member(cog.bot, obj.author)
-    if member is None or VERIF_ROLE not in get_role_ids(member):
-        try:
-            member_data = cog.db.get_member_data(obj.author.id)
-        except MemberNotFound:
-            return CheckResult(True, None)
-        if not member_data[MemberKey.ID_VER]:
-            return CheckResult(True, None)
+    if not await was_verified(cog, obj.author):
+        return CheckResult(True, None)
     return CheckResult(False, "You are already verified.")
 
 def is_admin_user(cog, obj, *args, **kwargs):
@@ -338,7 +372,8 @@ def is_admin_user(cog, obj, *args, **kwargs):
         2. Error message to supply, if check failed.
     """
     member = get_member(cog.bot, obj.author)
-    if set(ADMIN_ROLES).isdisjoint(get_role_ids(member)):
+    if member is None \
+        or ADMIN_ROLE_IDS.isdisjoint(r.id for r in member.roles):
         return CheckResult(False, "You are not authorised to do that.")
     return CheckResult(True, None)
 
@@ -375,8 +410,8 @@ def in_ver_channel(cog, obj, *args, **kwargs):
         1. Boolean result of check.
         2. Error message to supply, if check failed.
     """
-    ver_channel = cog.guild.get_channel(VER_CHANNEL)
-    if obj.channel.id != ver_channel.id:
+    if obj.channel.id != VER_CHANNEL:
+        ver_channel = cog.guild.get_channel(VER_CHANNEL)
         return CheckResult(False, "That command can only be used in "
             f"{ver_channel.mention}.")
     return CheckResult(True, None)
@@ -399,6 +434,27 @@ def in_admin_channel(cog, obj, *args, **kwargs):
             "that.")
     return CheckResult(True, None)
 
+def is_admin_in_admin_channel(cog, obj, *args, **kwargs):
+    """Checks that function was invoked in admin channel by an admin user.
+
+    Combines in_admin_channel and is_admin_user into a single check. Channel
+    is checked first, as it does not require looking up the invoker's roles.
+
+    Associated cog must have bot as instance variable.
+
+    Args:
+        cog: Cog associated with function invocation.
+        obj: Object associated with function invocation.
+
+    Returns:
+        1. Boolean result of check.
+        2. Error message to supply, if check failed.
+    """
+    res = in_admin_channel(cog, obj, *args, **kwargs)
+    if not res.status:
+        return res
+    return is_admin_user(cog, obj, *args, **kwargs)
+
 def in_dm_channel(cog, obj, *args, **kwargs):
     """Checks that function was invoked in DM channel.
     
@@ -429,7 +485,7 @@ def is_human(cog, obj, *args, **kwargs):
         1. Boolean result of check.
         2. Error message to supply, if check failed.
     """
-    if not (isinstance(obj, User) or isinstance(obj, Member)):
+    if not isinstance(obj, (User, Member)):
         obj = obj.author
     if obj.bot:
         return CheckResult(False, "You are not human.")
@@ -448,15 +504,19 @@ def is_not_command(cog, message, *args, **kwargs):
         1. Boolean result of check.
         2. Error message to supply, if check failed.
     """
-    if message.content.startswith(PREFIX) \
-        and cog.bot.get_command(message.content.split(" ")[0][1:]):
-        return CheckResult(False, "That is a command.")
+    content = message.content
+    if content.startswith(COMMAND_PREFIXES):
+        for prefix in COMMAND_PREFIXES:
+            if content.startswith(prefix) and cog.bot.get_command(
+                content[len(prefix):].split(" ", 1)[0]):
+                return CheckResult(False, "That is a command.")
     return CheckResult(True, None)
 
 def get_member(bot, user):
     """Get member of guild given User object.
     
-    Guild defined in config.
+    Guild defined in config. If user is already a Member of that guild, it is
+    returned as is without looking it up again.
 
     Args:
         bot: Bot object, must be member of guild.
@@ -465,15 +525,46 @@ def get_member(bot, user):
     Returns:
         The Member object associated with given context.
     """
+    if isinstance(user, Member) and user.guild.id == SERVER_ID:
+        return user
     return bot.get_guild(SERVER_ID).get_member(user.id)
 
-def get_role_ids(member):
-    """Get list of IDs of all roles member has.
+async def was_verified(cog, user):
+    """Returns whether user was verified in past.
+
+    Verified in past defined as either verified in the database or currently
+    has verified rank (defined in config) in Discord. Database is only queried
+    if user does not have verified rank. Bots are never considered verified,
+    without querying database.
+
+    Args:
+        cog: Cog with bot and db as instance variables.
+        user: User object to check.
+
+    Returns:
+        Boolean value representing whether user was verified in past.
+    """
+    if user.bot:
+        return False
+    member = get_member(cog.bot, user)
+    if member is not None and has_role(member, VERIF_ROLE):
+        return True
+    try:
+        member_data = await cog.db.get_member_flags(user.id)
+    except MemberNotFound:
+        return False
+    return bool(member_data[MemberKey.ID_VER])
+
+def has_role(member, role_id):
+    """Returns whether member has role with given ID.
+
+    Stops at the first matching role rather than collecting all role IDs.
 
     Args:
         member: Member object.
+        role_id: Integer representing ID of role.
 
     Returns:
-        List of IDs of all roles member has.
+        Boolean value representing whether member has role.
     """
-    return [r.id for r in member.roles]
+    return any(r.id == role_id for r in member.roles)
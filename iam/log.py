@@ -1,6 +1,9 @@
 """Handle creation of loggers."""
 
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 from time import time, localtime, strftime
 from collections import defaultdict
 from discord import Message, Member, User
@@ -22,11 +25,69 @@ FILENAME_TIME_FMT = "%Y-%m-%d_%H-%M-%S"
 FILENAME = f"logs/{strftime(FILENAME_TIME_FMT, localtime(time()))}.log"
 """Log filename format."""
 
+_QUEUE = SimpleQueue()
+"""Queue that all loggers pass records through to the listener thread."""
+
+_LISTENER = None
+"""Listener thread that writes queued records to console and file."""
+
+class _DestinationLevels(logging.Filter):
+    """Record the console and file levels of a logger on each of its records.
+
+    Lets a single pair of handlers on the listener thread apply the levels of
+    whichever logger a record came from.
+    """
+
+    def __init__(self, c_level, f_level):
+        """Init filter with given levels.
+
+        Args:
+            c_level: Logging level for console.
+            f_level: Logging level for file.
+        """
+        super().__init__()
+        self.c_level = c_level
+        self.f_level = f_level
+
+    def filter(self, record):
+        record.c_level = self.c_level
+        record.f_level = self.f_level
+        return True
+
+def _start_listener():
+    """Start listener thread for all loggers, if not already started.
+
+    Listener is stopped when the process exits, after writing any records
+    still in the queue.
+    """
+    global _LISTENER
+    if _LISTENER is not None:
+        return
+
+    c_handler = logging.StreamHandler()
+    c_handler.addFilter(lambda record: record.levelno >= record.c_level)
+    c_formatter = logging.Formatter(CONSOLE_LOG_FMT, CONSOLE_TIME_FMT)
+    c_handler.setFormatter(c_formatter)
+
+    f_handler = logging.FileHandler(FILENAME)
+    f_handler.addFilter(lambda record: record.levelno >= record.f_level)
+    f_formatter = logging.Formatter(FILE_LOG_FMT, FILE_TIME_FMT)
+    f_handler.setFormatter(f_formatter)
+
+    _LISTENER = QueueListener(_QUEUE, c_handler, f_handler)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
+
 def new_logger(name, c_level=logging.INFO, f_level=logging.DEBUG):
     """Create a new logger with the given name.
 
     Initialise it with constants set at the top of log.py.
 
+    Records are passed through a queue to a background thread that writes them
+    to the console and file, so logging does not block the event loop on I/O.
+    All loggers share the one queue and thread. Records below both levels are
+    dropped by the logger itself, before any work is done to format them.
+
     Args:
         name: String representing name of the logger to be created.
         c_level: Logging level for console.
@@ -35,22 +96,14 @@ def new_logger(name, c_level=logging.INFO, f_level=logging.DEBUG):
     Returns:
         The new logger.
     """
-    import logging
-
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(min(c_level, f_level))
 
-    c_handler = logging.StreamHandler()
-    c_handler.setLevel(c_level)
-    c_formatter = logging.Formatter(CONSOLE_LOG_FMT, CONSOLE_TIME_FMT)
-    c_handler.setFormatter(c_formatter)
-    logger.addHandler(c_handler)
-
-    f_handler = logging.FileHandler(FILENAME)
-    f_handler.setLevel(f_level)
-    f_formatter = logging.Formatter(FILE_LOG_FMT, FILE_TIME_FMT)
-    f_handler.setFormatter(f_formatter)
-    logger.addHandler(f_handler)
+    q_handler = QueueHandler(_QUEUE)
+    q_handler.setLevel(min(c_level, f_level))
+    q_handler.addFilter(_DestinationLevels(c_level, f_level))
+    logger.addHandler(q_handler)
+    _start_listener()
 
     return logger
 
@@ -64,6 +117,8 @@ def log_func(logger, level, meta, *args, **kwargs):
         *args: Args supplied to function call.
         **kwargs: Keyword args supplied to function call.
     """
+    if not logger.isEnabledFor(level):
+        return
     arg_reps = []
     for arg in args:
         arg_dict = OBJECT_TO_REP[type(arg)](arg)
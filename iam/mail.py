@@ -1,9 +1,12 @@
 """Handle email functions."""
 
 import boto3
-from botocore.exceptions import ClientError
+from asyncio import Lock, get_running_loop, sleep
+from botocore.config import Config
+from botocore.exceptions import ClientError, ConnectionError, HTTPClientError
 from discord.ext.commands import Cog
 from re import search
+from time import monotonic
 
 from iam.log import new_logger
 from iam.config import (
@@ -19,6 +22,19 @@ COG_NAME = "Mail"
 EMAIL_REGEX = r"^([a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+)$"
 """Any string that matches this regex is a valid email."""
 
+SES_MAX_SEND_RATE = 14
+"""Maximum number of emails to send to Amazon SES per second."""
+
+SES_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    max_pool_connections=SES_MAX_SEND_RATE,
+    tcp_keepalive=True
+)
+"""Config for Amazon SES client.
+
+Connections are kept alive and pooled so that consecutive sends reuse them
+rather than paying for a new TLS handshake each time."""
+
 def setup(bot):
     """Add Mail cog to bot and set up logging.
 
@@ -72,16 +88,50 @@ def is_valid_email(email):
     return search(EMAIL_REGEX, email) is not None
 
 class Mail(Cog, name=COG_NAME):
-    """Handle email functions"""
+    """Handle email functions.
+
+    Connection to Amazon SES is deferred until the bot is ready, so loading
+    this cog does not hold up the bot logging in to Discord.
+
+    Attributes:
+        client: Amazon SES client. None until connected.
+    """
 
     def __init__(self, logger):
-        """Init cog and connect to Amazon SES."""
+        """Init cog."""
         self.logger = logger
-        self.client = connect()
+        self.client = None
+        self._connect_lock = Lock()
+        self._next_send_time = 0
 
-    def send_email(self, recipient, subject, body_text):
+    @Cog.listener()
+    async def on_ready(self):
+        """Connect to Amazon SES once bot is ready, if not yet connected.
+
+        A cheap request is made so that the first email sent does not have to
+        wait for a connection to be set up.
+        """
+        if self.client is not None:
+            return
+        client = await self._connect()
+        try:
+            await get_running_loop().run_in_executor(None,
+                client.get_send_quota)
+        except (ClientError, ConnectionError, HTTPClientError) as err:
+            LOG.warning(f"Failed to warm up connection to Amazon SES ({err})")
+
+    async def send_email(self, recipient, subject, body_text):
         """Send plaintext email via Amazon SES.
 
+        The request is made in an executor thread so that the event loop is not
+        blocked while waiting on Amazon SES.
+
+        Sends are spaced out so that no more than SES_MAX_SEND_RATE are made
+        per second, keeping within the Amazon SES sending quota.
+
+        If the connection to Amazon SES has dropped, reconnect and try once
+        more before giving up.
+
         Args:
             recipient: String representing Email address of intended recipient.
             subject: String representing subject line of email.
@@ -91,29 +141,101 @@ class Mail(Cog, name=COG_NAME):
         Raises:
             MailError: If email fails to send.
         """
+        await self._wait_for_send_slot()
         LOG.debug(f"Sending SES email to {recipient}...")
+        loop = get_running_loop()
+        client = self.client
+        if client is None:
+            client = await self._connect()
         try:
-            response = self.client.send_email(
-                Destination={"ToAddresses": [recipient]},
-                Message={
-                    "Body": {
-                        "Text": {
-                            "Charset": "UTF-8",
-                            "Data": body_text
-                        }
-                    },
-                    "Subject": {
-                        "Charset": "UTF-8",
-                        "Data": subject
-                    }
-                },
-                Source=EMAIL
-            )
+            try:
+                response = await loop.run_in_executor(None, self._send,
+                    client, recipient, subject, body_text)
+            except (ConnectionError, HTTPClientError) as err:
+                LOG.warning(f"Lost connection to Amazon SES ({err}), "
+                    "reconnecting...")
+                client = await self._connect(client)
+                response = await loop.run_in_executor(None, self._send,
+                    client, recipient, subject, body_text)
             LOG.info(f"SES email '{response['MessageId']}' "
                 f"sent to '{recipient}'")
-        except ClientError:
+        except (ClientError, ConnectionError, HTTPClientError):
             raise MailError(recipient)
 
+    def cog_unload(self):
+        """Close connection to Amazon SES when cog is removed."""
+        self.close()
+
+    def close(self):
+        """Close connection to Amazon SES, if one is open.
+
+        Cog will reconnect if another email is sent afterwards.
+        """
+        if self.client is None:
+            return
+        self.client.close()
+        self.client = None
+        LOG.info("Closed connection to Amazon SES")
+
+    async def _connect(self, stale=None):
+        """Connect to Amazon SES, replacing client that lost its connection.
+
+        Only one connection is made at a time. If another send has already
+        reconnected, its client is used rather than connecting again.
+
+        Args:
+            stale: Client that lost its connection, or None if not yet
+                   connected.
+
+        Returns:
+            Connected Amazon SES client.
+        """
+        async with self._connect_lock:
+            if self.client is not None and self.client is not stale:
+                return self.client
+            if self.client is not None:
+                self.client.close()
+            self.client = await get_running_loop().run_in_executor(None,
+                connect)
+            return self.client
+
+    async def _wait_for_send_slot(self):
+        """Wait until another email can be sent within SES_MAX_SEND_RATE."""
+        now = monotonic()
+        send_time = max(now, self._next_send_time)
+        self._next_send_time = send_time + 1 / SES_MAX_SEND_RATE
+        if send_time > now:
+            await sleep(send_time - now)
+
+    def _send(self, client, recipient, subject, body_text):
+        """Make send email request to Amazon SES.
+
+        Args:
+            client: Amazon SES client to send with.
+            recipient: String representing Email address of intended recipient.
+            subject: String representing subject line of email.
+            body_text: String representing body text of the email.
+
+        Returns:
+            Dict containing response from Amazon SES.
+        """
+        return client.send_email(
+            Destination={"ToAddresses": [recipient]},
+            Message={
+                "Body": {
+                    "Text": {
+                        "Charset": "UTF-8",
+                        "Data": body_text
+                    }
+                },
+                "Subject": {
+                    "Charset": "UTF-8",
+                    "Data": subject
+                }
+            },
+            Source=EMAIL
+        )
+
 def connect():
     """Connect to Amazon SES.
     
@@ -124,7 +246,8 @@ def connect():
         'ses',
         region_name=AWS_REGION,
         aws_access_key_id=AWS_ACCESS_KEY_ID,
-        aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        config=SES_CLIENT_CONFIG
     )
     LOG.info("Logged in to Amazon SES")
     return client
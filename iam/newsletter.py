@@ -2,12 +2,13 @@
 
 from mailchimp_marketing import Client
 from mailchimp_marketing.api_client import ApiClientError
+from asyncio import get_running_loop
 from hashlib import md5
 from discord.ext.commands import Cog, group
 
 from iam.db import MemberKey
 from iam.log import new_logger
-from iam.config import PREFIX, MAILCHIMP_API_KEY, MAILCHIMP_LIST_ID
+from iam.config import MAILCHIMP_API_KEY, MAILCHIMP_LIST_ID
 from iam.hooks import (
     pre, post, check, log_attempt, log_invoke, log_success,
     verified_in_db
@@ -86,6 +87,35 @@ def subscriber_hash(email):
     """
     return md5(email.lower().encode()).hexdigest()
 
+async def set_subscription(client, list_id, member_data, status):
+    """Set newsletter subscription status of member in Mailchimp.
+
+    The request to Mailchimp is made in an executor thread so that the event
+    loop is not blocked while waiting on it.
+
+    Args:
+        client: Mailchimp Client object.
+        list_id: String representing Mailchimp list ID.
+        member_data: Dict containing data from member entry in database.
+        status: String representing Mailchimp subscription status to set.
+
+    Raises:
+        ApiClientError: If request to Mailchimp fails.
+    """
+    email = member_data[MemberKey.EMAIL]
+    zid = member_data[MemberKey.ZID]
+    await get_running_loop().run_in_executor(None,
+        client.lists.set_list_member, list_id, subscriber_hash(email), {
+        "email_address": email,
+        "status_if_new": status,
+        "status": status,
+        "merge_fields": {
+            "FNAME": member_data[MemberKey.NAME],
+            "MMERGE2": "No" if zid is None else "Yes",
+            "MMERGE3": "" if zid is None else zid
+        }
+    })
+
 async def proc_subscribe(client, list_id, db, user, channel):
     """Subscribe a user to the newsletter using their stored email.
 
@@ -96,20 +126,9 @@ async def proc_subscribe(client, list_id, db, user, channel):
         user: User object to subscribe.
         channel: Channel to send confirmation message to.
     """
-    member_data = db.get_member_data(user.id)
-    email = member_data[MemberKey.EMAIL]
-    zid = member_data[MemberKey.ZID]
+    member_data = await db.get_member_data(user.id)
     try:
-        res = client.lists.set_list_member(list_id, subscriber_hash(email), {
-            "email_address": email,
-            "status_if_new": "subscribed",
-            "status": "subscribed",
-            "merge_fields": {
-                "FNAME": member_data[MemberKey.NAME],
-                "MMERGE2": "No" if zid is None else "Yes",
-                "MMERGE3": "" if zid is None else zid
-            }
-        })
+        await set_subscription(client, list_id, member_data, "subscribed")
     except ApiClientError as e:
         raise SubscriptionError(channel, user, "Oops! Something went wrong "
             "while attempting to subscribe you to the newsletter. Please "
@@ -129,20 +148,9 @@ async def proc_unsubscribe(client, list_id, db, user, channel):
         user: User object to unsubscribe.
         channel: Channel to send confirmation message to.
     """
-    member_data = db.get_member_data(user.id)
-    email = member_data[MemberKey.EMAIL]
-    zid = member_data[MemberKey.ZID]
+    member_data = await db.get_member_data(user.id)
     try:
-        res = client.lists.set_list_member(list_id, subscriber_hash(email), {
-            "email_address": email,
-            "status_if_new": "unsubscribed",
-            "status": "unsubscribed",
-            "merge_fields": {
-                "FNAME": member_data[MemberKey.NAME],
-                "MMERGE2": "No" if zid is None else "Yes",
-                "MMERGE3": "" if zid is None else zid
-            }
-        })
+        await set_subscription(client, list_id, member_data, "unsubscribed")
     except ApiClientError as e:
         raise SubscriptionError(channel, user, "Oops! Something went wrong "
             "while attempting to unsubscribe you from the newsletter. Please "
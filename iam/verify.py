@@ -1,26 +1,28 @@
 """Handle automatic verification of server members."""
 
+from asyncio import gather
 from enum import IntEnum
-from functools import wraps
+from functools import lru_cache, wraps
 from time import time
-from re import search
+import re
 import hmac
+from hashlib import sha256
 from discord.ext.commands import Cog, group, command
 from discord import Member, NotFound
 from logging import DEBUG
 
 from iam.log import new_logger
-from iam.db import MemberKey, make_def_member_data, SecretID, MemberNotFound
+from iam.db import (
+    MemberKey, make_def_member_data, SecretID, MemberNotFound, MEMBER_ID_FIELD
+)
 from iam.mail import MailError, is_valid_email
 from iam.config import (
-    PREFIX, SERVER_ID, VERIF_ROLE, ADMIN_CHANNEL, JOIN_ANNOUNCE_CHANNEL,
-    MAX_VER_EMAILS
+    PREFIX, SERVER_ID, VERIF_ROLE, ADMIN_CHANNEL, JOIN_ANNOUNCE_CHANNEL
 )
 from iam.hooks import (
     pre, post, check, CheckResult, log_attempt, log_invoke, log_success,
-    has_verified_role, was_verified_user, is_unverified_user,
-    never_verified_user, is_admin_user, is_guild_member, in_ver_channel,
-    in_admin_channel, in_dm_channel, is_human, is_not_command
+    was_verified_user, is_unverified_user, is_admin_in_admin_channel,
+    is_guild_member, in_ver_channel, in_dm_channel, is_human, is_not_command
 )
 
 LOG = new_logger(__name__)
@@ -29,8 +31,41 @@ LOG = new_logger(__name__)
 COG_NAME = "Verify"
 """Name of this module's cog."""
 
-ZID_REGEX = r"^[zZ][0-9]{7}$"
-"""Any string that matches this regex is a valid zID."""
+ZID_REGEX = r"[zZ][0-9]{7}"
+"""Any string that fully matches this regex is a valid zID."""
+
+ZID_PATTERN = re.compile(ZID_REGEX)
+"""Compiled form of ZID_REGEX."""
+
+MAX_MESSAGE_LEN = 2000
+"""Maximum number of characters Discord allows in a message."""
+
+NAME_REQUEST_MESSAGE = (
+    "Arc - UNSW Student Life strongly recommends all student societies "
+    "verify their members' identities before allowing them to interact with "
+    "their online communities (Arc Clubs Handbook section 22.2)\n"
+    "\n"
+    "To send messages in our PCSoc Discord server, we require the following:\n"
+    "(1) Your full name\n"
+    "(2) Whether or not you're a student at UNSW\n"
+    "  (2a) If yes, your UNSW-issued zID\n"
+    "\n"
+    "  (2b) If not, your email address\n"
+    "  (3b) Your government-issued photo ID (e.g. driver's license or photo "
+    "card).\n"
+    "\n"
+    "The information you share with us is only accessible by our current "
+    "executive team - we do not share this with any other parties. You may "
+    "request to have your record deleted if you are no longer a member of "
+    "PCSoc.\n"
+    "If you have questions or you're stuck, feel free to message any of our "
+    "executives :)\n"
+    "-----\n"
+    "(1) What is your full name as it appears on your government-issued ID?\n"
+    "You can restart this verification process "
+    f"at any time by typing `{PREFIX}restart`."
+)
+"""Message sent to member when requesting their name."""
 
 def setup(bot):
     """Add Verify cog to bot.
@@ -39,6 +74,9 @@ def setup(bot):
         bot: Bot object to add cog to.
     """
     LOG.debug(f"Setting up {__name__} extension...")
+    if type(sha256()).__module__ != "_hashlib":
+        LOG.warning("SHA-256 is not backed by OpenSSL, verification codes "
+            "will be slower to generate")
     cog = Verify(bot, LOG)
     LOG.debug(f"Initialised {COG_NAME} cog")
     bot.add_cog(cog)
@@ -69,18 +107,30 @@ def _next_state(state):
 
     Used with the Verify class to implement a finite state machine.
 
+    Decorated function accepts an extra patch keyword arg: a dict of other
+    member keys and values to write in the same database update as the state
+    change.
+
+    The update is queued with Database.update_member_data_nowait, so the
+    member's next message is handled from the cached entry without waiting
+    for Firestore to confirm the write.
+
     Args:
         state: The state to transition to once function completes execution.
     """
+    # Written as a plain int, matching what is read back from the database.
+    value = int(state)
+
     def decorator(func):
         @wraps(func)
-        async def wrapper(db, member, *args):
+        async def wrapper(db, member, *args, patch=None):
             await func(db, member, *args)
-            db.update_member_data(member.id, {MemberKey.VER_STATE: state})
+            db.update_member_data_nowait(member.id,
+                {**(patch or {}), MemberKey.VER_STATE: value})
         return wrapper
     return decorator
 
-def _awaiting_approval(db, ctx, member, *args, **kwargs):
+async def _awaiting_approval(db, ctx, member, *args, **kwargs):
     """Raises exception if member is not awaiting approval.
     
     Can only be used within the Verify cog.
@@ -94,7 +144,7 @@ def _awaiting_approval(db, ctx, member, *args, **kwargs):
         CheckFailed: If invoker does not have verified role.
     """
     try:
-        member_data = db.get_member_data(member.id)
+        member_data = await db.get_member_data(member.id)
     except MemberNotFound:
         return CheckResult(False, "That user is not currently being verified.")
     if member_data[MemberKey.ID_VER]:
@@ -112,9 +162,9 @@ def is_valid_zid(zid):
     Returns:
         Boolean value representing whether string is a valid zID.
     """
-    return search(ZID_REGEX, zid) is not None
+    return ZID_PATTERN.fullmatch(zid) is not None
 
-def is_verifying_user(cog, ctx, *args, **kwargs):
+async def is_verifying_user(cog, ctx, *args, **kwargs):
     """Checks that user that invoked function is undergoing verification.
 
     Associated cog must have db as an instance variable.
@@ -124,22 +174,57 @@ def is_verifying_user(cog, ctx, *args, **kwargs):
         cog: Cog associated with function invocation.
         ctx: Context object associated with function invocation.
 
-    Raises:
-        CheckFailed: If invoker does not have verified role.
+    Returns:
+        1. Boolean result of check.
+        2. Error message to supply, if check failed.
     """
     try:
-        member_data = cog.db.get_member_data(ctx.author.id)
+        member_data = await cog.db.get_member_data(ctx.author.id)
     except MemberNotFound:
-        return False, "You are not currently being verified."
+        return CheckResult(False, "You are not currently being verified.")
     if member_data[MemberKey.VER_STATE] is None:
-        return False, "You are not currently being verified."
+        return CheckResult(False, "You are not currently being verified.")
     elif member_data[MemberKey.ID_VER]:
-        return False, "You are already verified."
-    return True, None
+        return CheckResult(False, "You are already verified.")
+    return CheckResult(True, None)
+
+@lru_cache(maxsize=4)
+def _hmac_prototype(secret):
+    """Get HMAC object keyed with secret, to be copied for each code.
+
+    Keying an HMAC object hashes the key into its inner and outer pads, so
+    this is done once per secret rather than once per code. Digest is given by
+    name so that the HMAC is computed by OpenSSL where available.
+
+    Args:
+        secret: Secret bytes to key HMAC with.
+
+    Returns:
+        HMAC-SHA256 object that has not been fed any message.
+    """
+    return hmac.new(secret, digestmod="sha256")
+
+@lru_cache(maxsize=4096)
+def _make_code(secret, seed):
+    """Generate verification code from secret and seed.
+
+    Codes are remembered, so a code that is sent and then checked is only
+    computed once. Changing the secret or seed gives a new code.
+
+    Args:
+        secret: Secret bytes to key HMAC with.
+        seed: Number derived from user ID to generate code for.
+
+    Returns:
+        Verification code as string of hex bytes.
+    """
+    code_hmac = _hmac_prototype(secret).copy()
+    code_hmac.update(str(seed).encode())
+    return code_hmac.hexdigest()
 
 @pre(log_invoke(LOG, level=DEBUG))
 @post(log_success(LOG))
-def get_code(db, user, noise):
+async def get_code(db, user, noise):
     """Generate verification code for user.
 
     Args:
@@ -150,9 +235,8 @@ def get_code(db, user, noise):
     Returns:
         Verification code as string of hex bytes.
     """
-    secret = db.get_secret(SecretID.VERIFY)
-    user_bytes = bytes(str(user.id + noise), "utf8")
-    return hmac.new(secret, user_bytes, "sha256").hexdigest()
+    secret = await db.get_secret(SecretID.VERIFY)
+    return _make_code(secret, user.id + noise)
 
 @pre(log_invoke(LOG))
 @post(log_success(LOG))
@@ -175,9 +259,9 @@ async def proc_begin(invoke_message, db, ver_role, admin_channel, member):
         member: Member object to begin verifying.
     """
     try:
-        member_data = db.get_member_data(member.id)
+        member_data = await db.get_member_data(member.id)
     except MemberNotFound:
-        db.set_member_data(member.id, make_def_member_data())
+        await db.set_member_data(member.id, make_def_member_data())
     else:
         if member_data[MemberKey.ID_VER]:
             LOG.info(f"Member {member} was already verified. "
@@ -203,7 +287,7 @@ async def proc_begin(invoke_message, db, ver_role, admin_channel, member):
             if email_attempts >= max_email_attempts:
                 # Member was previously rejected but ran out of email
                 # verification attempts. Grant them 2 more.
-                db.update_member_data(member.id, {
+                await db.update_member_data(member.id, {
                     MemberKey.MAX_EMAIL_ATTEMPTS: max_email_attempts + 2
                 })
 
@@ -223,7 +307,7 @@ async def proc_restart(db, user):
         user: User object to restart verification for.
     """
     try:
-        member_data = db.get_member_data(user.id)
+        member_data = await db.get_member_data(user.id)
     except MemberNotFound:
         await user.send("You are not currently being verified.")
         return
@@ -234,12 +318,12 @@ async def proc_restart(db, user):
         await user.send("You are not currently being verified.")
         return
     elif member_data[MemberKey.VER_STATE] in \
-        [State.AWAIT_ID, State.AWAIT_APPROVAL]:
+        (State.AWAIT_ID, State.AWAIT_APPROVAL):
         await user.send("You cannot restart after verifying your email!")
         return
 
     async with user.typing():
-        db.update_member_data(user.id, {
+        await db.update_member_data(user.id, {
             MemberKey.VER_STATE: None,
             MemberKey.VER_TIME: time()
         })
@@ -255,22 +339,7 @@ async def proc_request_name(db, member):
     Args:
         member: Member object to make request to.
     """
-    await member.send("Arc - UNSW Student Life strongly recommends all student societies verify their members' identities before allowing them to interact with their online communities (Arc Clubs Handbook section 22.2)\n"
-                      "\n"
-                      "To send messages in our PCSoc Discord server, we require the following:\n"
-                      "(1) Your full name\n"
-                      "(2) Whether or not you're a student at UNSW\n"
-                      "  (2a) If yes, your UNSW-issued zID\n"
-                      "\n"
-                      "  (2b) If not, your email address\n"
-                      "  (3b) Your government-issued photo ID (e.g. driver's license or photo card).\n"
-                      "\n"
-                      "The information you share with us is only accessible by our current executive team - we do not share this with any other parties. You may request to have your record deleted if you are no longer a member of PCSoc.\n"
-                      "If you have questions or you're stuck, feel free to message any of our executives :)\n"
-                      "-----\n"
-                      "(1) What is your full name as it appears on your government-issued ID?\n"
-                      "You can restart this verification process "
-                     f"at any time by typing `{PREFIX}restart`.")
+    await member.send(NAME_REQUEST_MESSAGE)
 
 @pre(log_invoke(LOG))
 @post(log_success(LOG))
@@ -291,8 +360,7 @@ async def state_await_name(db, member, full_name):
             "or fewer. Please try again.")
         return
 
-    db.update_member_data(member.id, {MemberKey.NAME: full_name})
-    await proc_request_unsw(db, member)
+    await proc_request_unsw(db, member, patch={MemberKey.NAME: full_name})
 
 @_next_state(State.AWAIT_UNSW)
 @pre(log_invoke(LOG))
@@ -362,13 +430,11 @@ async def state_await_zid(db, mail, member, member_data, zid):
         return
     email = f"{zid}@unsw.edu.au"
 
-    db.update_member_data(member.id, {
+    await proc_send_email(db, mail, member, member_data, email, patch={
         MemberKey.ZID: zid,
         MemberKey.EMAIL: email
     })
 
-    await proc_send_email(db, mail, member, member_data, email)
-
 @_next_state(State.AWAIT_EMAIL)
 @pre(log_invoke(LOG))
 @post(log_success(LOG))
@@ -399,13 +465,12 @@ async def state_await_email(db, mail, member, member_data, email):
             "Please try again.")
         return
 
-    db.update_member_data(member.id, {MemberKey.EMAIL: email})
-
-    await proc_send_email(db, mail, member, member_data, email)
+    await proc_send_email(db, mail, member, member_data, email,
+        patch={MemberKey.EMAIL: email})
 
 @pre(log_invoke(LOG))
 @post(log_success(LOG))
-async def proc_send_email(db, mail, member, member_data, email):
+async def proc_send_email(db, mail, member, member_data, email, patch=None):
     """Send verification code to member's email address.
 
     If email sends successfully, proceed to request code from member.
@@ -416,6 +481,8 @@ async def proc_send_email(db, mail, member, member_data, email):
         member: Member object to send email to.
         member_data: Dict containing data from member entry in database.
         email: Member's email address.
+        patch: Dict of other member keys and values to write along with the
+               state change, if email sends successfully.
     """
     email_attempts = member_data[MemberKey.EMAIL_ATTEMPTS]
     max_email_attempts = member_data[MemberKey.MAX_EMAIL_ATTEMPTS]
@@ -424,11 +491,11 @@ async def proc_send_email(db, mail, member, member_data, email):
             "Please DM an exec to continue verification.")
         return
 
-    code = get_code(db, member, member_data[MemberKey.VER_TIME])
+    code = await get_code(db, member, member_data[MemberKey.VER_TIME])
 
     try:
         async with member.typing():
-            mail.send_email(email, "PCSoc Discord Verification", 
+            await mail.send_email(email, "PCSoc Discord Verification",
                 f"Your code is {code}")
     except MailError as err:
         err.notify()
@@ -437,11 +504,10 @@ async def proc_send_email(db, mail, member, member_data, email):
             "been entered correctly.")
         return
 
-    db.update_member_data(member.id, {
+    await proc_request_code(db, member, patch={
+        **(patch or {}),
         MemberKey.EMAIL_ATTEMPTS: email_attempts + 1
     })
-    
-    await proc_request_code(db, member)
 
 @_next_state(State.AWAIT_CODE)
 @pre(log_invoke(LOG))
@@ -476,22 +542,25 @@ async def state_await_code(db, ver_role, admin_channel, join_announce_channel,
         member_data: Dict containing data from member entry in database.
         received_code: Message string received from member.
     """
-    expected_code = get_code(db, member, member_data[MemberKey.VER_TIME])
-    if not hmac.compare_digest(received_code, expected_code):
+    expected_code = await get_code(db, member,
+        member_data[MemberKey.VER_TIME])
+    if not hmac.compare_digest(received_code.encode("utf8"),
+        expected_code.encode("utf8")):
         await member.send("That was not the correct code. Please try "
             "again.\nYou can request another email by typing "
             f"`{PREFIX}resend`.")
         return
 
-    db.update_member_data(member.id, {
+    patch = {
         MemberKey.EMAIL_VER: True,
         MemberKey.VER_TIME: time()
-    })
+    }
     
     if member_data[MemberKey.ZID] is None:
-        await proc_request_id(db, member)
+        await proc_request_id(db, member, patch=patch)
     else:
-        db.update_member_data(member.id, {
+        await db.update_member_data(member.id, {
+            **patch,
             MemberKey.ID_VER: True
         })
         await proc_grant_rank(ver_role, admin_channel, join_announce_channel,
@@ -553,6 +622,9 @@ async def proc_forward_id_admins(db, member, admin_channel, member_data,
     attachments):
     """Forward member ID attachments to admin channel.
 
+    Attachments are downloaded concurrently. Member is only told they were
+    forwarded once the admin channel message has been sent.
+
     Proceed to await exec approval or rejection of member.
 
     Args:
@@ -564,14 +636,15 @@ async def proc_forward_id_admins(db, member, admin_channel, member_data,
     """
     full_name = member_data[MemberKey.NAME]
     async with member.typing():
-        files = [await a.to_file() for a in attachments]
+        files = await gather(*(a.to_file() for a in attachments))
         message = await admin_channel.send("Received attachment(s) "
             f"from {member.mention}. Please verify that name on ID is "
             f"`{full_name}`, then type `{PREFIX}verify approve "
             f"{member.id}` or `{PREFIX}verify reject {member.id} "
             "\"reason\"`.", files=files)
 
-    db.update_member_data(member.id, {MemberKey.ID_MESSAGE: message.id})
+    db.update_member_data_nowait(member.id,
+        {MemberKey.ID_MESSAGE: message.id})
 
     await member.send("Your attachment(s) have been forwarded to the "
         "execs. Please wait.")
@@ -606,7 +679,7 @@ async def proc_exec_approve(db, channel, member, join_announce_channel, exec,
         exec: Member object representing approving exec.
         ver_role: Verified role to grant to member.
     """
-    db.update_member_data(member.id, {
+    await db.update_member_data(member.id, {
         MemberKey.ID_VER: True,
         MemberKey.VER_EXEC: exec.id
     })
@@ -618,7 +691,8 @@ async def proc_exec_approve(db, channel, member, join_announce_channel, exec,
 async def proc_exec_reject(db, channel, member, reason):
     """Reject member awaiting exec approval and send them reason.
 
-    Deletes member from the database.
+    Deletes member from the database. Member and channel are then notified
+    concurrently.
 
     Args:
         db: Database object.
@@ -626,42 +700,49 @@ async def proc_exec_reject(db, channel, member, reason):
         member: Member object to reject verification for.
         reason: String representing rejection reason.
     """
-    db.update_member_data(member.id, {
+    await db.update_member_data(member.id, {
         MemberKey.VER_STATE: None
     })
 
-    await member.send("Your verification request has been denied "
-        f"for the following reason(s): `{reason}`.\n"
-        f"You can start a new request by typing `{PREFIX}verify` in the "
-        "verification channel.")
-
-    await channel.send("Rejected verification request from "
-        f"{member.mention}.")
+    await gather(
+        member.send("Your verification request has been denied "
+            f"for the following reason(s): `{reason}`.\n"
+            f"You can start a new request by typing `{PREFIX}verify` in the "
+            "verification channel."),
+        channel.send(f"Rejected verification request from {member.mention}.")
+    )
 
 @pre(log_invoke(LOG))
 @post(log_success(LOG))
 async def proc_display_pending(db, guild, channel):
     """Display list of members currently awaiting exec approval.
 
+    Members are streamed from the database and the list is sent in parts as
+    it fills up, so neither the full set of members nor the full list is held
+    in memory, and long lists do not exceed the Discord message length limit.
+
     Args:
         db: Database object.
         guild: Guild object to retrieve member data from.
         channel: Channel object to send list of members to.
     """
-    mentions = []
-    verifying = db.get_unverified_members_data()
-    for member_id in verifying:
-        if verifying[member_id][MemberKey.VER_STATE] \
-            == State.AWAIT_APPROVAL:
-            member = guild.get_member(member_id)
-            mentions.append(f"{member.mention}: {member_id}")
-    
-    if len(mentions) == 0:
+    text = "__Members awaiting approval:__"
+    found = False
+    async for member_id, _ in db.iter_unverified_members(
+        fields=[MEMBER_ID_FIELD], ver_state=State.AWAIT_APPROVAL):
+        found = True
+        line = f"{guild.get_member(member_id).mention}: {member_id}"
+        if len(text) + len(line) + 1 > MAX_MESSAGE_LEN:
+            await channel.send(text)
+            text = line
+        else:
+            text = f"{text}\n{line}"
+
+    if not found:
         await channel.send("No members currently awaiting approval.")
         return
 
-    mentions_formatted = "\n".join(mentions)
-    await channel.send(f"__Members awaiting approval:__\n{mentions_formatted}")
+    await channel.send(text)
 
 @pre(check(_awaiting_approval, notify=True))
 @pre(log_invoke(LOG))
@@ -680,7 +761,7 @@ async def proc_resend_id(db, channel, member):
         channel: Channel object associated with command invocation.
         member: Member object to retrieve ID attachments from.
     """
-    member_data = db.get_member_data(member.id)
+    member_data = await db.get_member_data(member.id)
     message_id = member_data[MemberKey.ID_MESSAGE]
     try:
         message = await channel.fetch_message(message_id)
@@ -691,7 +772,7 @@ async def proc_resend_id(db, channel, member):
     attachments = message.attachments
 
     async with channel.typing():
-        files = [await a.to_file() for a in attachments]
+        files = await gather(*(a.to_file() for a in attachments))
         full_name = member_data[MemberKey.NAME]
         await channel.send("Previously received attachment(s) from "
             f"{member.mention}. Please verify that name on ID is "
@@ -734,7 +815,7 @@ async def proc_verify_manual(db, ver_role, channel, join_announce_channel,
         await channel.send("That is neither a valid zID nor "
             "a valid email.")
         return
-    db.set_member_data(member.id, member_data)
+    await db.set_member_data(member.id, member_data)
     await proc_grant_rank(ver_role, channel, join_announce_channel, member)
 
 @pre(log_invoke(LOG))
@@ -770,32 +851,34 @@ async def proc_grant_rank(ver_role, admin_channel, join_announce_channel,
         join_announce_channel: Channel object to send join announcements to.
         member: Member object to grant verified rank to.
         silent: Boolean representing whether default confirmation messages
-            should be sent to member/admin channel.
+            should be sent to member/admin channel. These are sent
+            concurrently.
     """
     await member.add_roles(ver_role)
     LOG.info(f"Granted verified rank to member '{member.id}'")
     if not silent:
-        await member.send("You are now verified. Welcome to the server! "
-            "If you are interested in subscribing to our newsletter, try the "
-            f"`{PREFIX}newsletter` command.")
-        await admin_channel.send(f"{member.mention} is now verified.")
-        await join_announce_channel.send(f"Welcome {member.mention} to PCSoc!")
+        await gather(
+            member.send("You are now verified. Welcome to the server! If you "
+                "are interested in subscribing to our newsletter, try the "
+                f"`{PREFIX}newsletter` command."),
+            admin_channel.send(f"{member.mention} is now verified."),
+            join_announce_channel.send(f"Welcome {member.mention} to PCSoc!")
+        )
 
 class Verify(Cog, name=COG_NAME):
     """Handle automatic verification of server members.
 
     Verification process for each member implemented as a finite state machine.
+    State of each member undergoing verification is kept in their database
+    entry rather than in this cog. Refer to iam.db.MemberKey.
 
     Attributes:
         State: Enum representing all possible states in the FSM.
-        verifying: Dict of all members undergoing verification. Keys are member
-                   Discord IDs and values are dicts containing state, name,
-                   zID, email, email verified status and ID verified status.
-                   Refer to iam.db.MemberKey.
         bot: Bot object that registered this cog.
-        guild: Guild object associated with bot, defined in config.
-        db: Database cog associated with bot.
-        mail: Mail cog associated with bot.
+        guild: Guild object associated with bot, defined in config. Cached
+               until Discord sends a new one.
+        db: Database cog associated with bot. Cached after first access.
+        mail: Mail cog associated with bot. Cached after first access.
     """
 
     def __init__(self, bot, logger):
@@ -807,30 +890,105 @@ class Verify(Cog, name=COG_NAME):
         LOG.debug(f"Initialising {COG_NAME} cog...")
         self.bot = bot
         self.logger = logger
+        self._db = None
+        self._mail = None
+        self._guild = None
+        self._ver_role = None
+        self._admin_channel = None
+        self._join_announce_channel = None
+        self._state_handlers = {
+            State.AWAIT_NAME: lambda member, member_data, message:
+                state_await_name(self.db, member, message.content),
+            State.AWAIT_UNSW: lambda member, member_data, message:
+                state_await_unsw(self.db, member, message.content),
+            State.AWAIT_ZID: lambda member, member_data, message:
+                state_await_zid(self.db, self.mail, member, member_data,
+                    message.content),
+            State.AWAIT_EMAIL: lambda member, member_data, message:
+                state_await_email(self.db, self.mail, member, member_data,
+                    message.content),
+            State.AWAIT_CODE: lambda member, member_data, message:
+                state_await_code(self.db, self.ver_role, self.admin_channel,
+                    self.join_announce_channel, member, member_data,
+                    message.content),
+            State.AWAIT_ID: lambda member, member_data, message:
+                state_await_id(self.db, self.admin_channel, member,
+                    member_data, message.attachments),
+            State.AWAIT_APPROVAL: lambda member, member_data, message:
+                state_await_approval()
+        }
 
     @property
     def guild(self):
-        return self.bot.get_guild(SERVER_ID)
+        if self._guild is None:
+            self._guild = self.bot.get_guild(SERVER_ID)
+        return self._guild
+
+    @Cog.listener()
+    async def on_guild_available(self, guild):
+        """Replace cached guild object when guild becomes available.
+
+        Discord sends fresh guild objects on every (re)connect, so role and
+        channel objects are resolved again from it here, ahead of the first
+        verification that needs them.
+
+        Args:
+            guild: Guild object that became available.
+        """
+        if guild.id == SERVER_ID:
+            self._guild = guild
+            self._ver_role = guild.get_role(VERIF_ROLE)
+            self._admin_channel = guild.get_channel(ADMIN_CHANNEL)
+            self._join_announce_channel = guild.get_channel(
+                JOIN_ANNOUNCE_CHANNEL)
+
+    @Cog.listener()
+    async def on_guild_unavailable(self, guild):
+        """Drop cached guild objects when guild becomes unavailable.
+
+        Args:
+            guild: Guild object that became unavailable.
+        """
+        if guild.id == SERVER_ID:
+            self._clear_guild_cache()
+
+    def _clear_guild_cache(self):
+        """Drop cached guild, role and channel objects."""
+        self._guild = None
+        self._ver_role = None
+        self._admin_channel = None
+        self._join_announce_channel = None
 
     @property
     def ver_role(self):
-        return self.guild.get_role(VERIF_ROLE)
+        if self._ver_role is None:
+            self._ver_role = self.guild.get_role(VERIF_ROLE)
+        return self._ver_role
 
     @property
     def admin_channel(self):
-        return self.guild.get_channel(ADMIN_CHANNEL)
+        if self._admin_channel is None:
+            self._admin_channel = self.guild.get_channel(ADMIN_CHANNEL)
+        return self._admin_channel
 
     @property
     def join_announce_channel(self):
-        return self.guild.get_channel(JOIN_ANNOUNCE_CHANNEL)
+        if self._join_announce_channel is None:
+            self._join_announce_channel = self.guild.get_channel(
+                JOIN_ANNOUNCE_CHANNEL)
+        return self._join_announce_channel
 
     @property
     def db(self):
-        return self.bot.get_cog("Database")
+        if self._db is None:
+            self._db = self.bot.get_cog("Database")
+        return self._db
 
     @property
     def mail(self):
-        return self.bot.get_cog("Mail")
+        if self._mail is None:
+            self._mail = self.bot.get_cog("Mail")
+        return self._mail
 
     @group(
         name="verify",
@@ -869,8 +1027,7 @@ class Verify(Cog, name=COG_NAME):
         usage="(Discord ID) __member__"
     )
     @pre(log_attempt(LOG))
-    @pre(check(in_admin_channel, notify=True))
-    @pre(check(is_admin_user, notify=True))
+    @pre(check(is_admin_in_admin_channel, notify=True))
     @pre(log_invoke(LOG))
     @post(log_success(LOG))
     async def cmd_verify_approve(self, ctx, member: Member):
@@ -892,8 +1049,7 @@ class Verify(Cog, name=COG_NAME):
         usage="(Discord ID) __member__ (multiple words) __reason__"
     )
     @pre(log_attempt(LOG))
-    @pre(check(in_admin_channel, notify=True))
-    @pre(check(is_admin_user, notify=True))
+    @pre(check(is_admin_in_admin_channel, notify=True))
     @pre(log_invoke(LOG))
     @post(log_success(LOG))
     async def cmd_verify_reject(self, ctx, member: Member, *, reason: str):
@@ -915,8 +1071,7 @@ class Verify(Cog, name=COG_NAME):
         usage=""
     )
     @pre(log_attempt(LOG))
-    @pre(check(is_admin_user, notify=True))
-    @pre(check(in_admin_channel, notify=True))
+    @pre(check(is_admin_in_admin_channel, notify=True))
     @pre(log_invoke(LOG))
     @post(log_success(LOG))
     async def cmd_verify_pending(self, ctx):
@@ -937,8 +1092,7 @@ class Verify(Cog, name=COG_NAME):
         usage="(Discord ID) __member__"
     )
     @pre(log_attempt(LOG))
-    @pre(check(in_admin_channel, notify=True))
-    @pre(check(is_admin_user, notify=True))
+    @pre(check(is_admin_in_admin_channel, notify=True))
     @pre(log_invoke(LOG))
     @post(log_success(LOG))
     async def cmd_verify_check(self, ctx, member_id):
@@ -962,8 +1116,7 @@ class Verify(Cog, name=COG_NAME):
         usage="(Discord ID) __member__ (quote) __name__ (word) __zID/Email__"
     )
     @pre(log_attempt(LOG))
-    @pre(check(in_admin_channel, notify=True))
-    @pre(check(is_admin_user, notify=True))
+    @pre(check(is_admin_in_admin_channel, notify=True))
     @pre(log_invoke(LOG))
     @post(log_success(LOG))
     async def cmd_verify_manual(self, ctx, member_id, name, arg):
@@ -1019,7 +1172,7 @@ class Verify(Cog, name=COG_NAME):
         Args:
             ctx: Context object associated with command invocation.
         """
-        member_data = self.db.get_member_data(ctx.author.id)
+        member_data = await self.db.get_member_data(ctx.author.id)
         await proc_resend_email(self.db, self.mail, ctx.author, member_data)
 
     @Cog.listener()
@@ -1054,40 +1207,25 @@ class Verify(Cog, name=COG_NAME):
         Args:
             message: Message object received.
         """
-        member = self.guild.get_member(message.author.id)
-        await self.proc_handle_state(member, message)
+        await self.proc_handle_state(message.author, message)
 
     @pre(log_invoke(LOG))
     @post(log_success(LOG))
-    async def proc_handle_state(self, member, message):
-        """Call current state handler for member upon receiving message.
+    async def proc_handle_state(self, user, message):
+        """Call current state handler for user upon receiving message.
+
+        User is only resolved to a guild member once a handler is found.
 
         Args:
-            member: Member object that sent message.
-            message: Message object sent by member.
+            user: User object that sent message.
+            message: Message object sent by user.
         """
         try:
-            member_data = self.db.get_member_data(member.id)
+            member_data = await self.db.get_member_data(user.id)
         except MemberNotFound:
             return
         if not member_data[MemberKey.ID_VER]:
-            state = member_data[MemberKey.VER_STATE]
-            if state == State.AWAIT_NAME:
-                await state_await_name(self.db, member, message.content)
-            elif state == State.AWAIT_UNSW:
-                await state_await_unsw(self.db, member, message.content)
-            elif state == State.AWAIT_ZID:
-                await state_await_zid(self.db, self.mail, member, member_data,
-                    message.content)
-            elif state == State.AWAIT_EMAIL:
-                await state_await_email(self.db, self.mail, member,
-                    member_data, message.content)
-            elif state == State.AWAIT_CODE:
-                await state_await_code(self.db, self.ver_role,
-                    self.admin_channel, self.join_announce_channel, member,
-                    member_data, message.content)
-            elif state == State.AWAIT_ID:
-                await state_await_id(self.db, self.admin_channel, member,
-                    member_data, message.attachments)
-            elif state == State.AWAIT_APPROVAL:
-                await state_await_approval()
+            handler = self._state_handlers.get(member_data[MemberKey.VER_STATE])
+            if handler is not None:
+                member = self.guild.get_member(user.id)
+                await handler(member, member_data, message)
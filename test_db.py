@@ -0,0 +1,172 @@
+"""Test the iam.db module."""
+
+import pytest
+from unittest.mock import patch, call, AsyncMock, MagicMock
+from iam.db import Database
+
+def new_mock_doc(id):
+    doc = MagicMock()
+    doc.id = str(id)
+    doc.update = AsyncMock()
+    doc.set = AsyncMock()
+    return doc
+
+def new_mock_batch():
+    batch = MagicMock()
+    batch.commit = AsyncMock()
+    return batch
+
+def new_db(batch):
+    db = Database(None, MagicMock())
+    docs = {}
+    db._get_member_doc = MagicMock(
+        side_effect=lambda id: docs.setdefault(id, new_mock_doc(id)))
+    db._get_client = MagicMock()
+    db._get_client.return_value.batch.return_value = batch
+    return db, docs
+
+@pytest.mark.asyncio
+async def test_update_member_data_nowait_coalesce():
+    """Queued writes to same member are merged and committed in one batch."""
+    # Setup
+    batch = new_mock_batch()
+    db, docs = new_db(batch)
+
+    # Call
+    db.update_member_data_nowait(0, {"a": 1, "b": 1})
+    db.update_member_data_nowait(1, {"a": 2})
+    db.update_member_data_nowait(0, {"b": 3})
+    await db.flush()
+
+    # Ensure one write per member committed in a single batch.
+    batch.update.assert_has_calls([call(docs[0], {"a": 1, "b": 3}),
+        call(docs[1], {"a": 2})])
+    assert batch.update.call_count == 2
+    batch.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_update_member_data_nowait_retry():
+    """Queued writes are requeued and retried if commit fails."""
+    # Setup
+    batch = new_mock_batch()
+    batch.commit.side_effect = [Exception("unavailable"), None]
+    db, docs = new_db(batch)
+
+    # Call
+    with patch("iam.db.WRITE_BATCH_DELAY", 0), \
+        patch("iam.db.WRITE_RETRY_DELAY", 0):
+        db.update_member_data_nowait(0, {"a": 1})
+        await db._write_task
+
+    # Ensure write committed again after failure.
+    assert batch.commit.await_count == 2
+    batch.update.assert_has_calls([call(docs[0], {"a": 1})] * 2)
+    assert db._pending_writes == {}
+
+@pytest.mark.asyncio
+async def test_update_member_data_nowait_retry_newer():
+    """Requeued writes do not overwrite newer writes queued meanwhile."""
+    # Setup
+    batch = new_mock_batch()
+    db, docs = new_db(batch)
+    def fail_commit():
+        batch.commit.side_effect = None
+        db.update_member_data_nowait(0, {"b": 2})
+        raise Exception("unavailable")
+    batch.commit.side_effect = fail_commit
+
+    # Call
+    with patch("iam.db.WRITE_BATCH_DELAY", 0), \
+        patch("iam.db.WRITE_RETRY_DELAY", 0):
+        db.update_member_data_nowait(0, {"a": 1, "b": 1})
+        await db._write_task
+
+    # Ensure newer write merged over failed write when retried.
+    batch.update.assert_has_calls([call(docs[0], {"a": 1, "b": 1}),
+        call(docs[0], {"a": 1, "b": 2})])
+    assert db._pending_writes == {}
+
+@pytest.mark.asyncio
+async def test_flush_standard():
+    """Flush commits every queued write, in as many batches as needed."""
+    # Setup
+    batch = new_mock_batch()
+    db, docs = new_db(batch)
+    for id in range(5):
+        db.update_member_data_nowait(id, {"a": id})
+
+    # Call
+    with patch("iam.db.WRITE_BATCH_SIZE", 2):
+        await db.flush()
+
+    # Ensure all writes committed and queue drained.
+    assert batch.commit.await_count == 3
+    assert batch.update.call_count == 5
+    assert db._pending_writes == {}
+    assert db._write_task.done()
+
+@pytest.mark.asyncio
+async def test_flush_commit_failed():
+    """Flush drops queued writes that still fail rather than retrying."""
+    # Setup
+    batch = new_mock_batch()
+    batch.commit.side_effect = Exception("unavailable")
+    db, docs = new_db(batch)
+    db.update_member_data_nowait(0, {"a": 1})
+
+    # Call
+    await db.flush()
+
+    # Ensure write tried once, then dropped.
+    batch.commit.assert_awaited_once()
+    assert db._pending_writes == {}
+
+@pytest.mark.asyncio
+async def test_update_member_data_queued():
+    """Foreground update carries queued write, overriding its keys."""
+    # Setup
+    batch = new_mock_batch()
+    db, docs = new_db(batch)
+    db.update_member_data_nowait(0, {"a": 1, "b": 1})
+
+    # Call
+    await db.update_member_data(0, {"b": 2})
+    await db.flush()
+
+    # Ensure queued write sent with update rather than in background.
+    docs[0].update.assert_awaited_once_with({"a": 1, "b": 2})
+    batch.commit.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_update_member_data_queued_failed():
+    """Queued write is requeued if foreground update carrying it fails."""
+    # Setup
+    batch = new_mock_batch()
+    db, docs = new_db(batch)
+    db.update_member_data_nowait(0, {"a": 1, "b": 1})
+    db._get_member_doc(0).update.side_effect = Exception("unavailable")
+
+    # Call
+    with pytest.raises(Exception):
+        await db.update_member_data(0, {"b": 2})
+    await db.flush()
+
+    # Ensure queued write committed in background instead.
+    batch.update.assert_called_once_with(docs[0], {"a": 1, "b": 1})
+    batch.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_set_member_data_queued():
+    """Foreground set replaces queued write."""
+    # Setup
+    batch = new_mock_batch()
+    db, docs = new_db(batch)
+    db.update_member_data_nowait(0, {"a": 1, "b": 1})
+
+    # Call
+    await db.set_member_data(0, {"b": 2})
+    await db.flush()
+
+    # Ensure queued write dropped in favour of set.
+    docs[0].set.assert_awaited_once_with({"b": 2}, merge=False)
+    batch.commit.assert_not_awaited()
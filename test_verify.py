@@ -12,7 +12,8 @@ from iam.verify import (
     proc_verify_manual, proc_grant_rank
 )
 from iam.db import (
-    MemberKey, MemberNotFound, make_def_member_data, MAX_VER_EMAILS
+    MemberKey, MemberNotFound, make_def_member_data, MAX_VER_EMAILS,
+    MEMBER_ID_FIELD
 )
 from iam.hooks import CheckFailed
 from iam.mail import MailError
@@ -21,7 +22,7 @@ import discord
 
 VALID_NAMES = ["Sabine Lim", "Test User", "kek", "", "X Æ A-12"]
 VALID_ZIDS = ["z5555555", "z1234567", "z0000000", "z5242579"]
-INVALID_ZIDS = ["5555555", "z12345678", "z0", "5242579z"]
+INVALID_ZIDS = ["5555555", "z12345678", "z0", "5242579z", "z5242579\n"]
 VALID_EMAILS = [
     "thesabinelim@gmail.com", "arcdelegate@unswpcsoc.com",
     "sabine.lim@unsw.edu.au", "z5242579@unsw.edu.au", "g@g.gg"
@@ -33,6 +34,11 @@ SAMPLE_REJECT_REASONS = ["photo unclear", "", "u suck", "invalid", "123456"]
 def filter_dict(dict, except_keys):
     return {k:v for k,v in dict.items() if k not in except_keys}
 
+def new_mock_db():
+    db = AsyncMock()
+    db.update_member_data_nowait = MagicMock()
+    return db
+
 def new_mock_user(id):
     user = AsyncMock()
     user.id = id
@@ -62,15 +68,19 @@ def new_mock_attachment(id):
     attachment.to_file.return_value = id
     return attachment
 
+async def async_iter(items):
+    for item in items:
+        yield item
+
 @pytest.mark.asyncio
 async def test_proc_begin_standard():
     """User not undergoing verification can begin verification."""
     # Setup
     invoke_message = new_mock_message(0)
-    db = MagicMock()
+    db = new_mock_db()
     ver_channel = new_mock_channel(0)
     member = new_mock_user(0)
-    db.get_member_data = MagicMock(side_effect=MemberNotFound(member.id, ""))
+    db.get_member_data = AsyncMock(side_effect=MemberNotFound(member.id, ""))
     before_time = time()
 
     # Call
@@ -106,8 +116,9 @@ async def test_proc_begin_standard():
                      f"at any time by typing `{PREFIX}restart`.")
 
     # Ensure user state updated to awaiting name.
-    db.update_member_data.assert_called_once_with(member.id,
+    db.update_member_data_nowait.assert_called_once_with(member.id,
         {MemberKey.VER_STATE: State.AWAIT_NAME})
+    db.update_member_data.assert_not_called()
 
     # Ensure no side effects occurred.
     member.add_roles.assert_not_awaited()
@@ -117,7 +128,7 @@ async def test_proc_begin_already_verifying():
     """User already undergoing verification sent error."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.VER_STATE] = state
@@ -143,7 +154,7 @@ async def test_proc_begin_already_verified():
     """User previously verified granted rank immediately."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         ver_role = AsyncMock()
         admin_channel = new_mock_channel(1)
@@ -180,7 +191,7 @@ async def test_proc_restart_standard():
     """User undergoing verification can restart verification."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         user = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.VER_STATE] = state
@@ -195,7 +206,7 @@ async def test_proc_restart_standard():
 
         # Ensure user entry in database updated correctly.
         call_args_list = db.update_member_data.call_args_list
-        assert len(call_args_list) == 2
+        assert len(call_args_list) == 1
         call_args = call_args_list[0].args
         assert call_args[0] == user.id
         assert filter_dict(call_args[1], [MemberKey.VER_TIME]) == \
@@ -222,7 +233,7 @@ async def test_proc_restart_standard():
                      f"at any time by typing `{PREFIX}restart`.")
 
         # Ensure user state updated to awaiting name.
-        db.update_member_data.assert_called_with(user.id,
+        db.update_member_data_nowait.assert_called_once_with(user.id,
             {MemberKey.VER_STATE: State.AWAIT_NAME})
 
         # Ensure no side effects occurred.
@@ -233,9 +244,9 @@ async def test_proc_restart_standard():
 async def test_proc_restart_never_verifying():
     """User never started verification sent error."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     user = new_mock_user(0)
-    db.get_member_data = MagicMock(side_effect=MemberNotFound(user.id, ""))
+    db.get_member_data = AsyncMock(side_effect=MemberNotFound(user.id, ""))
 
     # Call
     await proc_restart(db, user)
@@ -255,7 +266,7 @@ async def test_proc_restart_never_verifying():
 async def test_proc_restart_not_verifying():
     """User not undergoing verification sent error."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     user = new_mock_user(0)
     db.get_member_data.return_value = make_def_member_data()
 
@@ -278,7 +289,7 @@ async def test_proc_restart_already_verified():
     """User already verified sent error."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         user = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.ID_VER] = True
@@ -303,25 +314,22 @@ async def test_proc_restart_already_verified():
 async def test_state_await_name_standard():
     """User sending valid name moves on to UNSW student question."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     member = new_mock_user(0)
     full_name = "Test User 0"
 
     # Call
     await state_await_name(db, member, full_name)
 
-    # Ensure user entry in database updated correctly.
-    call_args_list = db.update_member_data.call_args_list
-    assert len(call_args_list) == 2
-    call_args = call_args_list[0].args
-    assert call_args == (member.id, {MemberKey.NAME: full_name})
-
     # Ensure user was sent prompt.
     member.send.assert_awaited_once_with("(2) Are you a UNSW student? Please type `y` or `n`.")
 
-    # Ensure user state updated to awaiting is UNSW.
-    call_args = call_args_list[1].args
-    assert call_args == (member.id, {MemberKey.VER_STATE: State.AWAIT_UNSW})
+    # Ensure user entry and state updated together.
+    db.update_member_data_nowait.assert_called_once_with(member.id, {
+        MemberKey.NAME: full_name,
+        MemberKey.VER_STATE: State.AWAIT_UNSW
+    })
+    db.update_member_data.assert_not_called()
 
     # Ensure no side effects occurred.
     member.add_roles.assert_not_awaited()
@@ -331,7 +339,7 @@ async def test_state_await_name_standard():
 async def test_state_await_name_too_long():
     """User sending name that is too long sent error."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     member = new_mock_user(0)
     full_name = "a" * 501
 
@@ -352,7 +360,7 @@ async def test_state_await_unsw_yes():
     """User answering yes moves on to zID question."""
     for ans in ["y", "Y", "yes", "Yes", "YES"]:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
 
         # Call
@@ -362,7 +370,7 @@ async def test_state_await_unsw_yes():
         member.send.awaited_once_with("(2a) What is your zID?")
 
         # Ensure user state updated to awaiting zID.
-        db.update_member_data.assert_called_once_with(member.id,
+        db.update_member_data_nowait.assert_called_once_with(member.id,
             {MemberKey.VER_STATE: State.AWAIT_ZID})
 
         # Ensure no side effects occurred.
@@ -374,7 +382,7 @@ async def test_state_await_unsw_no():
     """User answering no moves on to email question."""
     for ans in ["n", "N", "no", "No", "NO"]:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
 
         # Call
@@ -384,7 +392,7 @@ async def test_state_await_unsw_no():
         member.send.awaited_once_with("(2b) What is your email address?")
 
         # Ensure user state updated to awaiting email.
-        db.update_member_data.assert_called_once_with(member.id,
+        db.update_member_data_nowait.assert_called_once_with(member.id,
             {MemberKey.VER_STATE: State.AWAIT_EMAIL})
 
         # Ensure no side effects occurred.
@@ -395,7 +403,7 @@ async def test_state_await_unsw_no():
 async def test_state_await_unsw_unrecognised():
     """User typing unrecognised response sent error."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     member = new_mock_user(0)
     ans = "kek"
 
@@ -415,8 +423,8 @@ async def test_state_await_zid_standard():
     """User sending valid zID moves on to proc_send_email."""
     for zid in VALID_ZIDS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         email = f"{zid}@unsw.edu.au"
@@ -425,28 +433,26 @@ async def test_state_await_zid_standard():
         with patch("iam.verify.proc_send_email") as mock_proc_send_email:
             await state_await_zid(db, mail, member, member_data, zid)
 
-        # Ensure user entry in database updated accordingly.
-        db.update_member_data.assert_called_once_with(member.id, {
-            MemberKey.ZID: zid,
-            MemberKey.EMAIL: email
-        })
-
-        # Ensure proc_send_email called.
+        # Ensure proc_send_email called with user entry update.
         mock_proc_send_email.assert_awaited_once_with(db, mail, member, 
-            member_data, email)
+            member_data, email, patch={
+                MemberKey.ZID: zid,
+                MemberKey.EMAIL: email
+            })
 
         # Ensure no side effects occurred.
         member.send.assert_not_awaited()
         member.add_roles.assert_not_awaited()
         db.set_member_data.assert_not_called()
+        db.update_member_data.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_state_await_zid_invalid():
     """User sending invalid zID sent error."""
     for zid in INVALID_ZIDS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         email = f"{zid}@unsw.edu.au"
@@ -470,8 +476,8 @@ async def test_state_await_email_standard():
     """User sending valid email moves on to proc_send_email."""
     for email in VALID_EMAILS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
 
@@ -479,27 +485,23 @@ async def test_state_await_email_standard():
         with patch("iam.verify.proc_send_email") as mock_proc_send_email:
             await state_await_email(db, mail, member, member_data, email)
 
-        # Ensure user entry in database updated accordingly.
-        db.update_member_data.assert_called_once_with(member.id, {
-            MemberKey.EMAIL: email
-        })
-
-        # Ensure proc_send_email called.
+        # Ensure proc_send_email called with user entry update.
         mock_proc_send_email.assert_awaited_once_with(db, mail, member, 
-            member_data, email)
+            member_data, email, patch={MemberKey.EMAIL: email})
 
         # Ensure no side effects occurred.
         member.send.assert_not_awaited()
         member.add_roles.assert_not_awaited()
         db.set_member_data.assert_not_called()
+        db.update_member_data.assert_not_called()
 
 @pytest.mark.asyncio
 async def test_state_await_email_invalid():
     """User sending invalid email sent error."""
     for email in INVALID_EMAILS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
 
@@ -522,8 +524,8 @@ async def test_proc_send_email_standard():
     """User sent email moves on to code question."""
     for email in VALID_EMAILS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         code = "cf137a"
@@ -534,25 +536,18 @@ async def test_proc_send_email_standard():
             await proc_send_email(db, mail, member, member_data, email)
 
         # Ensure user was sent email.
-        mail.send_email.assert_called_once_with(email, 
+        mail.send_email.assert_awaited_once_with(email, 
             "PCSoc Discord Verification", f"Your code is {code}")
 
-        # Ensure user entry in database updated accordingly.
-        call_args_list = db.update_member_data.call_args_list
-        assert len(call_args_list) == 2
-        call_args = call_args_list[0].args
-        assert call_args == (member.id, {
-            MemberKey.EMAIL_ATTEMPTS: member_data[MemberKey.EMAIL_ATTEMPTS] + 1
-        })
-
         # Ensure user was sent prompt.
         member.send.assert_awaited_once_with("Please enter the code sent to "
             "your email (check your spam folder if you don't see it).\n"
             f"You can request another email by typing `{PREFIX}resend`.")
 
-        # Ensure user state updated to awaiting code.
-        call_args = call_args_list[1].args
-        assert call_args == (member.id, {
+        # Ensure user entry and state updated together.
+        db.update_member_data_nowait.assert_called_once_with(member.id, {
+            MemberKey.EMAIL_ATTEMPTS:
+                member_data[MemberKey.EMAIL_ATTEMPTS] + 1,
             MemberKey.VER_STATE: State.AWAIT_CODE
         })
 
@@ -565,8 +560,8 @@ async def test_proc_send_email_out_of_attempts():
     """User who was sent too many emails previously sent error."""
     for email in VALID_EMAILS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.EMAIL_ATTEMPTS] = MAX_VER_EMAILS
@@ -579,7 +574,7 @@ async def test_proc_send_email_out_of_attempts():
             "emails. Please DM an exec to continue verification.")
 
         # Ensure user not sent email.
-        mail.send_email.assert_not_called()
+        mail.send_email.assert_not_awaited()
 
         # Ensure no side effects occurred.
         member.add_roles.assert_not_awaited()
@@ -591,9 +586,9 @@ async def test_proc_send_email_failed():
     """When email bounces, user sent error without using up an attempt."""
     for email in VALID_EMAILS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
-        mail.send_email = MagicMock(side_effect=MailError(email))
+        db = new_mock_db()
+        mail = AsyncMock()
+        mail.send_email = AsyncMock(side_effect=MailError(email))
         member = new_mock_user(0)
         member_data = make_def_member_data()
         code = "cf137a"
@@ -604,7 +599,7 @@ async def test_proc_send_email_failed():
             await proc_send_email(db, mail, member, member_data, email)
 
         # Ensure email sending attempted.
-        mail.send_email.assert_called_once_with(email, 
+        mail.send_email.assert_awaited_once_with(email, 
             "PCSoc Discord Verification", f"Your code is {code}")
 
         # Ensure user was sent error.
@@ -623,7 +618,7 @@ async def test_state_await_code_unsw():
     for zid in VALID_ZIDS:
         for code in SAMPLE_CODES:
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             ver_role = AsyncMock()
             member = new_mock_user(0)
             admin_channel = new_mock_channel(1)
@@ -665,7 +660,7 @@ async def test_state_await_code_non_unsw():
     """Student sending matching code verified."""
     for code in SAMPLE_CODES:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         ver_role = AsyncMock()
         member = new_mock_user(0)
         admin_channel = new_mock_channel(1)
@@ -708,7 +703,7 @@ async def test_state_await_code_invalid_unsw():
         for expected_code in SAMPLE_CODES:
             for received_code in ["wowee", "", "1nv4l1d", "!"]:
                 # Setup
-                db = MagicMock()
+                db = new_mock_db()
                 ver_role = AsyncMock()
                 member = new_mock_user(0)
                 admin_channel = new_mock_channel(1)
@@ -737,7 +732,7 @@ async def test_state_await_code_invalid_non_unsw():
     for expected_code in SAMPLE_CODES:
         for received_code in ["wowee", "", "1nv4l1d", "!"]:
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             ver_role = AsyncMock()
             member = new_mock_user(0)
             admin_channel = new_mock_channel(1)
@@ -764,8 +759,8 @@ async def test_proc_resend_email_standard():
     """User requesting resend sent another email."""
     for email in VALID_EMAILS:
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.EMAIL] = email
@@ -792,8 +787,8 @@ async def test_proc_resend_email_not_awaiting_code():
             if state == State.AWAIT_CODE:
                 pass
         # Setup
-        db = MagicMock()
-        mail = MagicMock()
+        db = new_mock_db()
+        mail = AsyncMock()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.EMAIL] = email
@@ -816,7 +811,7 @@ async def test_state_await_id_standard():
     """User sending attachments forwarded to admin channel."""
     for n_attach in range(1, 11):
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         admin_channel = new_mock_channel(1)
         member_data = make_def_member_data()
@@ -840,7 +835,7 @@ async def test_state_await_id_standard():
 async def test_state_await_id_no_attachments():
     """User sending no attachments sent error."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     member = new_mock_user(0)
     admin_channel = new_mock_channel(1)
     member_data = make_def_member_data()
@@ -869,7 +864,7 @@ async def test_proc_forward_id_admins_standard():
     for full_name in VALID_NAMES:
         for n_attach in range(1, 11):
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             admin_channel = new_mock_channel(1)
             admin_channel.send.return_value = new_mock_message(1337)
@@ -889,10 +884,11 @@ async def test_proc_forward_id_admins_standard():
                 "\"reason\"`.", files=[await a.to_file() for a in attachments])
 
             # Ensure user entry in database updated accordingly.
-            call_args_list = db.update_member_data.call_args_list
+            call_args_list = db.update_member_data_nowait.call_args_list
             assert len(call_args_list) == 2
             call_args = call_args_list[0].args
             assert call_args == (member.id, {MemberKey.ID_MESSAGE: 1337})
+            db.update_member_data.assert_not_called()
 
             # Ensure notification sent to user.
             member.send.assert_awaited_once_with("Your attachment(s) have "
@@ -911,7 +907,7 @@ async def test_proc_forward_id_admins_standard():
 async def test_proc_exec_approve_standard():
     """Exec approving verifying user grants rank to user."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     member = new_mock_user(0)
     member_data = make_def_member_data()
     member_data[MemberKey.VER_STATE] = State.AWAIT_APPROVAL
@@ -948,7 +944,7 @@ async def test_proc_exec_approve_not_awaiting():
         if state == State.AWAIT_APPROVAL:
             continue
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.VER_STATE] = state
@@ -980,7 +976,7 @@ async def test_proc_exec_approve_already_verified():
     """Exec approving user already verified sends error."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.ID_VER] = True
@@ -1012,9 +1008,9 @@ async def test_proc_exec_approve_never_verifying():
     """Exec approving user never started verification sends error."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
-        db.get_member_data = MagicMock(side_effect=
+        db.get_member_data = AsyncMock(side_effect=
             MemberNotFound(member.id, ""))
         exec = new_mock_user(1)
         channel = new_mock_channel(2)
@@ -1043,7 +1039,7 @@ async def test_proc_exec_reject_standard():
     """Exec rejecting verifying user notifies user and updates accordingly."""
     for reason in SAMPLE_REJECT_REASONS:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.VER_STATE] = State.AWAIT_APPROVAL
@@ -1079,7 +1075,7 @@ async def test_proc_exec_reject_not_awaiting():
         if state == State.AWAIT_APPROVAL:
             continue
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.VER_STATE] = state
@@ -1106,7 +1102,7 @@ async def test_proc_exec_reject_already_verified():
     """Exec rejecting user already verified sends error."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.ID_VER] = True
@@ -1133,9 +1129,9 @@ async def test_proc_exec_reject_never_verifying():
     """Exec rejecting user never started verification sends error."""
     for state in State:
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
-        db.get_member_data = MagicMock(side_effect=
+        db.get_member_data = AsyncMock(side_effect=
             MemberNotFound(member.id, ""))
         channel = new_mock_channel(1)
 
@@ -1157,14 +1153,31 @@ async def test_proc_exec_reject_never_verifying():
 @pytest.mark.asyncio
 async def test_proc_display_pending_standard():
     """Send list of pending approvals on request."""
-    pass
+    # Setup
+    db = new_mock_db()
+    db.iter_unverified_members = MagicMock(return_value=async_iter(
+        [(0, {}), (1, {})]))
+    guild = new_mock_guild(0)
+    guild.get_member = MagicMock(side_effect=new_mock_user)
+    channel = new_mock_channel(1)
+
+    # Call
+    await proc_display_pending(db, guild, channel)
+
+    # Ensure only IDs of members awaiting approval retrieved.
+    db.iter_unverified_members.assert_called_once_with(
+        fields=[MEMBER_ID_FIELD], ver_state=State.AWAIT_APPROVAL)
+
+    # Ensure list sent in channel.
+    channel.send.assert_awaited_once_with("__Members awaiting approval:__\n"
+        "@User_0#0000: 0\n@User_1#0000: 1")
 
 @pytest.mark.asyncio
 async def test_proc_display_pending_none():
     """Send error if no pending approvals."""
     # Setup
-    db = MagicMock()
-    db.get_unverified_members_data.return_value = []
+    db = new_mock_db()
+    db.iter_unverified_members = MagicMock(return_value=async_iter([]))
     guild = new_mock_guild(0)
     channel = new_mock_channel(1)
 
@@ -1181,7 +1194,7 @@ async def test_proc_resend_id_standard():
     for full_name in VALID_NAMES:
         for n_attach in range(1, 11):
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             member_data = make_def_member_data()
             member_data[MemberKey.NAME] = full_name
@@ -1220,7 +1233,7 @@ async def test_proc_resend_id_not_awaiting():
             if state == State.AWAIT_APPROVAL:
                 continue
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             member_data = make_def_member_data()
             member_data[MemberKey.ID_MESSAGE] = i
@@ -1249,7 +1262,7 @@ async def test_proc_resend_id_already_verified():
     for i in range(10):
         for state in State:
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             member_data = make_def_member_data()
             member_data[MemberKey.ID_MESSAGE] = i
@@ -1277,9 +1290,9 @@ async def test_proc_resend_id_already_verified():
 async def test_proc_resend_id_never_verifying():
     """Send error if user never started verification."""
     # Setup
-    db = MagicMock()
+    db = new_mock_db()
     member = new_mock_user(0)
-    db.get_member_data = MagicMock(side_effect=
+    db.get_member_data = AsyncMock(side_effect=
         MemberNotFound(member.id, ""))
     channel = new_mock_channel(1)
 
@@ -1303,7 +1316,7 @@ async def test_proc_resend_id_not_found():
     """Send error if previous message containing attachments not found."""
     for i in range(10):
         # Setup
-        db = MagicMock()
+        db = new_mock_db()
         member = new_mock_user(0)
         member_data = make_def_member_data()
         member_data[MemberKey.ID_MESSAGE] = i
@@ -1332,7 +1345,7 @@ async def test_proc_verify_manual_unsw_standard():
     for full_name in VALID_NAMES:
         for zid in VALID_ZIDS:
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             exec = new_mock_user(1)
             channel = new_mock_channel(2)
@@ -1376,7 +1389,7 @@ async def test_proc_verify_manual_unsw_invalid_zid():
     for full_name in VALID_NAMES:
         for zid in INVALID_ZIDS:
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             exec = new_mock_user(1)
             channel = new_mock_channel(2)
@@ -1405,7 +1418,7 @@ async def test_proc_verify_manual_non_unsw_standard():
     for full_name in VALID_NAMES:
         for email in VALID_EMAILS:
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             exec = new_mock_user(1)
             channel = new_mock_channel(2)
@@ -1448,7 +1461,7 @@ async def test_proc_verify_manual_non_unsw_invalid_email():
     for full_name in VALID_NAMES:
         for email in INVALID_EMAILS:
             # Setup
-            db = MagicMock()
+            db = new_mock_db()
             member = new_mock_user(0)
             exec = new_mock_user(1)
             channel = new_mock_channel(2)